@@ -3,16 +3,17 @@
 import asyncio
 import logging
 from pathlib import Path
-
-from PySide6.QtWidgets import QApplication
+from typing import TYPE_CHECKING
 
 from .protocols import IConfigManager, IDeviceInfo, IPluginManager, IServerClient, ITrayManager
 from .event_bus import EventBus, Topics
 from .plugin_base import PluginEvent
 from .models import TriggerPayload, ActionTask
 from .constants import DEFAULT_RECONNECT_INTERVAL_MS
-from ui.settings import SettingsWindow
-from ui.tray import ConnectionStatus
+from ui.tray_enums import ConnectionStatus
+
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QApplication
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +35,7 @@ class Application:
         server_client: IServerClient,
         tray_manager: ITrayManager,
         event_bus: EventBus,
-        app: QApplication,
+        app: "QApplication",
         loop: asyncio.AbstractEventLoop
     ):
         """Initialize application with dependencies.
@@ -206,6 +207,9 @@ class Application:
         """
         logger.info("Opening settings window")
 
+        # Imported here so importing core.application doesn't load Qt widgets
+        from ui.settings import SettingsWindow
+
         settings_window = SettingsWindow(
             config_manager=self.config_manager,
             plugin_manager=self.plugin_manager,
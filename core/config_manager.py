@@ -1,10 +1,15 @@
 """Configuration manager for the application."""
 
-import json
+import atexit
+import os
+import threading
 import uuid
+import weakref
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
+from core import json_utils
 from core.constants import (
     DEFAULT_SERVER_URL,
     DEFAULT_LOG_LEVEL,
@@ -12,31 +17,90 @@ from core.constants import (
     DEFAULT_RECONNECT_INTERVAL_MS,
 )
 
+# Read-only defaults shared by all ConfigManager instances
+_DEFAULTS = MappingProxyType({
+    "server_url": DEFAULT_SERVER_URL,
+    "device_key": "",
+    "device_id": None,
+    "auto_connect": DEFAULT_AUTO_CONNECT,
+    "reconnect_interval": DEFAULT_RECONNECT_INTERVAL_MS,
+    "log_level": DEFAULT_LOG_LEVEL,
+    "device_linked": False,
+})
+
+# Managers with delayed saving, flushed at exit; weak so they can be collected
+_delayed_save_managers: "weakref.WeakSet[ConfigManager]" = weakref.WeakSet()
+
+
+def _flush_delayed_saves() -> None:
+    """Write pending changes of every live delayed-save ConfigManager."""
+    for manager in list(_delayed_save_managers):
+        manager.flush()
+
+
+atexit.register(_flush_delayed_saves)
+
 
 class ConfigManager:
-    """Manages application configuration."""
+    """Manages application configuration.
+
+    By default changes are only written by an explicit save(). With
+    ``save_delay`` set, set()/update() also schedule a background save
+    after that many seconds, so bursts of changes collapse into one
+    write; flush() forces it, and pending changes are flushed at exit.
+    """
 
-    def __init__(self, config_path: Path):
+    def __init__(self, config_path: Path, save_delay: float | None = None):
         self.config_path = config_path
+        # String forms used for file I/O, so load/save skip Path rebuilding
+        self._path_str = os.fspath(config_path)
+        self._parent_str = os.path.dirname(self._path_str)
+        self._tmp_path_str = self._path_str + ".tmp"
+        self._parent_created = False
         self._config: dict[str, Any] = {}
-        self._defaults: dict[str, Any] = {
-            "server_url": DEFAULT_SERVER_URL,
-            "device_key": "",
-            "device_id": None,
-            "auto_connect": DEFAULT_AUTO_CONNECT,
-            "reconnect_interval": DEFAULT_RECONNECT_INTERVAL_MS,
-            "log_level": DEFAULT_LOG_LEVEL,
-            "device_linked": False,
-        }
+        self._defaults = _DEFAULTS
+        self._save_delay = save_delay
+        self._save_lock = threading.Lock()
+        # Guards top-level changes to _config against the snapshot taken by
+        # save(), which may run on the delayed-save timer thread
+        self._config_lock = threading.Lock()
+        self._save_timer: threading.Timer | None = None
+        self._dirty = False
+        if save_delay is not None:
+            _delayed_save_managers.add(self)
 
     def load(self) -> dict[str, Any]:
-        """Load configuration from file."""
+        """Load configuration from file.
+
+        Never writes: a missing file yields the defaults, and a missing
+        device_id is generated in memory only. Use ensure() to persist them.
+        """
+        self._read()
+        return self._config
+
+    def ensure(self) -> dict[str, Any]:
+        """Load configuration, creating or completing the file if needed.
+
+        Writes the file when it is missing or lacks a device_id, so the
+        generated ID stays stable across runs. Call once at startup.
+        """
+        if self._read():
+            self.save()
+        return self._config
+
+    def _read(self) -> bool:
+        """Read the config file into memory.
+
+        Returns:
+            True if the in-memory config differs from the file on disk
+        """
         needs_save = False
+        self._cancel_pending_save()
 
-        if self.config_path.exists():
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                self._config = json.load(f)
-        else:
+        try:
+            with open(self._path_str, "rb") as f:
+                self._config = json_utils.loads(f.read())
+        except FileNotFoundError:
             self._config = self._defaults.copy()
             needs_save = True
 
@@ -45,16 +109,48 @@ class ConfigManager:
             self._config["device_id"] = str(uuid.uuid4())
             needs_save = True
 
-        if needs_save:
-            self.save()
-
-        return self._config
+        return needs_save
 
     def save(self) -> None:
-        """Save configuration to file."""
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(self._config, f, indent=2, ensure_ascii=False)
+        """Save configuration to file.
+
+        Keys are written in sorted order so the file is stable across
+        saves. It is written to a temporary sibling and swapped in with
+        os.replace(), so readers never see a partially written config.
+        """
+        self._cancel_pending_save()
+        with self._save_lock:
+            with self._config_lock:
+                snapshot = dict(self._config)
+            if not self._parent_created:
+                os.makedirs(self._parent_str or ".", exist_ok=True)
+                self._parent_created = True
+            with open(self._tmp_path_str, "wb") as f:
+                f.write(json_utils.dumps_pretty(snapshot, sort_keys=True))
+            os.replace(self._tmp_path_str, self._path_str)
+
+    def flush(self) -> None:
+        """Write pending changes scheduled by set()/update(), if any."""
+        if self._dirty:
+            self.save()
+
+    def _schedule_save(self) -> None:
+        """Mark the config dirty and (re)arm the delayed save timer."""
+        if self._save_delay is None:
+            return
+        self._dirty = True
+        if self._save_timer is None:
+            timer = threading.Timer(self._save_delay, self.flush)
+            timer.daemon = True
+            self._save_timer = timer
+            timer.start()
+
+    def _cancel_pending_save(self) -> None:
+        """Drop any scheduled save; the caller writes or reloads instead."""
+        self._dirty = False
+        timer, self._save_timer = self._save_timer, None
+        if timer is not None and timer is not threading.current_thread():
+            timer.cancel()
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
@@ -64,28 +160,34 @@ class ConfigManager:
 
     def set(self, key: str, value: Any) -> None:
         """Set a configuration value."""
-        self._config[key] = value
+        with self._config_lock:
+            self._config[key] = value
+        self._schedule_save()
 
     def update(self, data: dict[str, Any]) -> None:
         """Update multiple configuration values."""
-        self._config.update(data)
+        with self._config_lock:
+            self._config.update(data)
+        self._schedule_save()
 
     @property
     def server_url(self) -> str:
         """Get server URL."""
-        return self.get("server_url", "")
+        return self._config.get("server_url", "")
 
     @property
     def device_key(self) -> str:
         """Get device key."""
-        return self.get("device_key", "")
+        return self._config.get("device_key", "")
 
     @property
     def device_id(self) -> str | None:
         """Get device ID."""
-        return self.get("device_id")
+        return self._config.get("device_id")
 
     @device_id.setter
     def device_id(self, value: str) -> None:
         """Set device ID."""
-        self.set("device_id", value)
+        with self._config_lock:
+            self._config["device_id"] = value
+        self._schedule_save()
@@ -1,11 +1,80 @@
 """Device information utilities."""
 
+import functools
 import platform
 import socket
 
 from core.protocols import IConfigManager
 
 
+@functools.cache
+def _is_raspberry() -> bool:
+    """Check the device-tree model for a Raspberry Pi (probed once)."""
+    try:
+        with open("/proc/device-tree/model", "rb") as f:
+            return b"raspberry" in f.read().lower()
+    except (FileNotFoundError, PermissionError):
+        return False
+
+
+@functools.cache
+def get_platform() -> str:
+    """Get the current platform name (probed once per process)."""
+    system = platform.system().lower()
+    if system == "darwin":
+        return "macos"
+    elif system == "windows":
+        return "windows"
+    elif system == "linux":
+        return "raspberry" if _is_raspberry() else "linux"
+    return system
+
+
+@functools.cache
+def get_hostname() -> str:
+    """Get the hostname of the current device (looked up once)."""
+    return socket.gethostname()
+
+
+@functools.cache
+def _probe_system_info() -> dict:
+    """Collect system information (cached by get_system_info)."""
+    return {
+        "platform": get_platform(),
+        "hostname": get_hostname(),
+        "system": platform.system(),
+        "release": platform.release(),
+        "version": platform.version(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "python_version": platform.python_version(),
+    }
+
+
+def get_system_info() -> dict:
+    """Get detailed system information.
+
+    The values don't change while the process runs, so they are probed
+    once; each call returns a fresh copy that callers may modify.
+    """
+    return dict(_probe_system_info())
+
+
+def refresh_hostname() -> str:
+    """Re-read the hostname, e.g. after it was changed on the system."""
+    get_hostname.cache_clear()
+    _probe_system_info.cache_clear()
+    return get_hostname()
+
+
+def _reset_cache() -> None:
+    """Drop the cached platform probes (used by tests)."""
+    _is_raspberry.cache_clear()
+    get_platform.cache_clear()
+    get_hostname.cache_clear()
+    _probe_system_info.cache_clear()
+
+
 class DeviceInfo:
     """Provides information about the current device."""
 
@@ -17,40 +86,7 @@ class DeviceInfo:
         """Get the device ID from configuration."""
         return self._config_manager.device_id
 
-    @staticmethod
-    def get_platform() -> str:
-        """Get the current platform name."""
-        system = platform.system().lower()
-        if system == "darwin":
-            return "macos"
-        elif system == "windows":
-            return "windows"
-        elif system == "linux":
-            # Check for Raspberry Pi
-            try:
-                with open("/proc/device-tree/model", "r") as f:
-                    if "raspberry" in f.read().lower():
-                        return "raspberry"
-            except (FileNotFoundError, PermissionError):
-                pass
-            return "linux"
-        return system
-
-    @staticmethod
-    def get_hostname() -> str:
-        """Get the hostname of the current device."""
-        return socket.gethostname()
-
-    @staticmethod
-    def get_system_info() -> dict:
-        """Get detailed system information."""
-        return {
-            "platform": DeviceInfo.get_platform(),
-            "hostname": DeviceInfo.get_hostname(),
-            "system": platform.system(),
-            "release": platform.release(),
-            "version": platform.version(),
-            "machine": platform.machine(),
-            "processor": platform.processor(),
-            "python_version": platform.python_version(),
-        }
+    # Module-level functions, kept on the class for existing callers
+    get_platform = staticmethod(get_platform)
+    get_hostname = staticmethod(get_hostname)
+    get_system_info = staticmethod(get_system_info)
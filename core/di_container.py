@@ -1,8 +1,11 @@
 """Dependency injection container for managing component lifecycles."""
 
+import functools
 import logging
+from collections import deque
 from pathlib import Path
-from typing import Any, Callable
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 from PySide6.QtWidgets import QApplication
 
@@ -18,6 +21,24 @@ from ui.tray import TrayManager
 logger = logging.getLogger(__name__)
 
 
+class _Registration:
+    """A registered component: its instance once resolved, and its factory."""
+
+    __slots__ = ("value", "factory", "resolved", "depends_on")
+
+    def __init__(
+        self,
+        value: Any = None,
+        factory: Callable[[], Any] | None = None,
+        resolved: bool = False,
+        depends_on: tuple[str, ...] = (),
+    ):
+        self.value = value
+        self.factory = factory
+        self.resolved = resolved
+        self.depends_on = depends_on
+
+
 class DIContainer:
     """Simple dependency injection container.
 
@@ -25,8 +46,10 @@ class DIContainer:
     """
 
     def __init__(self):
-        self._singletons: dict[str, Any] = {}
-        self._factories: dict[str, Callable[[], Any]] = {}
+        # One record per name, so get() resolves with a single lookup
+        self._registrations: Mapping[str, _Registration] = {}
+        self._frozen = False
+        self._init_order: tuple[str, ...] = ()
 
     def register_singleton(self, name: str, instance: Any) -> None:
         """Register a singleton instance.
@@ -34,20 +57,113 @@ class DIContainer:
         Args:
             name: Component name
             instance: Component instance
+
+        Raises:
+            RuntimeError: If the container is frozen
         """
-        self._singletons[name] = instance
+        self._check_not_frozen(name)
+        registration = self._registrations.get(name)
+        if registration is None:
+            self._registrations[name] = _Registration(value=instance, resolved=True)
+        else:
+            # Update in place so existing resolvers see the instance
+            registration.value = instance
+            registration.resolved = True
         logger.debug(f"Registered singleton: {name}")
 
-    def register_factory(self, name: str, factory: Callable[[], Any]) -> None:
+    def register_factory(
+        self,
+        name: str,
+        factory: Callable[[], Any],
+        depends_on: tuple[str, ...] = (),
+    ) -> None:
         """Register a factory function.
 
+        An already registered singleton keeps taking precedence.
+
         Args:
             name: Component name
             factory: Factory function that creates the component
+            depends_on: Names of components the factory resolves
+
+        Raises:
+            RuntimeError: If the container is frozen
         """
-        self._factories[name] = factory
+        self._check_not_frozen(name)
+        registration = self._registrations.get(name)
+        if registration is None:
+            self._registrations[name] = _Registration(factory=factory, depends_on=depends_on)
+        else:
+            registration.factory = factory
+            registration.depends_on = depends_on
         logger.debug(f"Registered factory: {name}")
 
+    def freeze(self) -> None:
+        """Close the container to further registrations.
+
+        Components can still be resolved; only the set of registered
+        names becomes fixed. The registrations are also put in dependency
+        order for eager_init().
+
+        Raises:
+            KeyError: If a factory depends on an unregistered component
+            ValueError: If factory dependencies form a cycle
+        """
+        self._init_order = self._dependency_order()
+        # Read-only view: the name set can't change behind the init order
+        self._registrations = MappingProxyType(self._registrations)
+        self._frozen = True
+
+    def eager_init(self) -> dict[str, Any]:
+        """Create all components now, each after its dependencies.
+
+        Returns:
+            Every resolved component by name, so callers need no further get()
+
+        Raises:
+            RuntimeError: If the container is not frozen yet
+        """
+        if not self._frozen:
+            raise RuntimeError("Container must be frozen before eager_init()")
+        registrations = self._registrations
+        return {name: self._resolve(registrations[name]) for name in self._init_order}
+
+    def _dependency_order(self) -> tuple[str, ...]:
+        """Topologically sort registrations by depends_on (Kahn's algorithm).
+
+        Components without dependencies keep their registration order.
+        """
+        indegree = dict.fromkeys(self._registrations, 0)
+        dependents: dict[str, list[str]] = {name: [] for name in self._registrations}
+        for name, registration in self._registrations.items():
+            for dependency in registration.depends_on:
+                if dependency not in dependents:
+                    raise KeyError(
+                        f"Component '{name}' depends on unknown component '{dependency}'"
+                    )
+                dependents[dependency].append(name)
+                indegree[name] += 1
+
+        ready = deque(name for name, count in indegree.items() if count == 0)
+        order = []
+        while ready:
+            name = ready.popleft()
+            order.append(name)
+            for dependent in dependents[name]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(indegree):
+            cycle = sorted(name for name, count in indegree.items() if count)
+            raise ValueError(f"Dependency cycle between components: {', '.join(cycle)}")
+        return tuple(order)
+
+    def _check_not_frozen(self, name: str) -> None:
+        """Raise if registering name would modify a frozen container."""
+        if self._frozen:
+            raise RuntimeError(f"Cannot register '{name}': container is frozen")
+
     def get(self, name: str) -> Any:
         """Get a component by name.
 
@@ -60,18 +176,40 @@ class DIContainer:
         Raises:
             KeyError: If component not found
         """
-        # Try singleton first
-        if name in self._singletons:
-            return self._singletons[name]
+        return self._resolve(self._lookup(name))
 
-        # Try factory
-        if name in self._factories:
-            instance = self._factories[name]()
-            # Cache singleton after creation
-            self._singletons[name] = instance
-            return instance
+    def resolver(self, name: str) -> Callable[[], Any]:
+        """Get a zero-argument callable that resolves a component.
+
+        The registration is looked up once, here, so factories that call
+        the resolver skip the by-name lookup of get().
+
+        Args:
+            name: Component name
 
-        raise KeyError(f"Component '{name}' not found in container")
+        Returns:
+            Callable returning the component instance
+
+        Raises:
+            KeyError: If component not found
+        """
+        return functools.partial(self._resolve, self._lookup(name))
+
+    def _lookup(self, name: str) -> _Registration:
+        """Find the registration for name or raise KeyError."""
+        registration = self._registrations.get(name)
+        if registration is None:
+            raise KeyError(f"Component '{name}' not found in container")
+        return registration
+
+    @staticmethod
+    def _resolve(registration: _Registration) -> Any:
+        """Return the registration's instance, creating it on first use."""
+        if not registration.resolved:
+            # Cache singleton after creation
+            registration.value = registration.factory()
+            registration.resolved = True
+        return registration.value
 
     def has(self, name: str) -> bool:
         """Check if component exists.
@@ -82,7 +220,7 @@ class DIContainer:
         Returns:
             True if component is registered
         """
-        return name in self._singletons or name in self._factories
+        return name in self._registrations
 
 
 class ContainerBuilder:
@@ -125,7 +263,7 @@ class ContainerBuilder:
         def create_config_manager() -> ConfigManager:
             config_path = data_dir / "config.json"
             config_manager = ConfigManager(config_path)
-            config_manager.load()
+            config_manager.ensure()
 
             # Set log level from config
             log_level = config_manager.get("log_level", "INFO")
@@ -134,16 +272,19 @@ class ContainerBuilder:
             return config_manager
 
         container.register_factory("config_manager", create_config_manager)
+        get_config_manager = container.resolver("config_manager")
 
         # Register DeviceInfo factory
         def create_device_info() -> DeviceInfo:
-            config_manager = container.get("config_manager")
-            device_info = DeviceInfo(config_manager)
+            device_info = DeviceInfo(get_config_manager())
             logger.info(f"Device ID: {device_info.device_id}")
             logger.info(f"Platform: {device_info.get_platform()}")
             return device_info
 
-        container.register_factory("device_info", create_device_info)
+        container.register_factory(
+            "device_info", create_device_info, depends_on=("config_manager",)
+        )
+        get_device_info = container.resolver("device_info")
 
         # Register PluginManager factory
         def create_plugin_manager() -> PluginManager | None:
@@ -158,8 +299,8 @@ class ContainerBuilder:
 
         # Register ServerClient factory
         def create_server_client() -> ServerClient:
-            config_manager = container.get("config_manager")
-            device_info = container.get("device_info")
+            config_manager = get_config_manager()
+            device_info = get_device_info()
 
             server_client = ServerClient(
                 server_url=config_manager.get("server_url", ""),
@@ -170,7 +311,10 @@ class ContainerBuilder:
             )
             return server_client
 
-        container.register_factory("server_client", create_server_client)
+        container.register_factory(
+            "server_client", create_server_client,
+            depends_on=("config_manager", "device_info"),
+        )
 
         # Register TrayManager factory
         def create_tray_manager() -> TrayManager:
@@ -178,5 +322,6 @@ class ContainerBuilder:
 
         container.register_factory("tray_manager", create_tray_manager)
 
+        container.freeze()
         logger.info("DI container configured")
         return container
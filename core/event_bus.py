@@ -4,7 +4,9 @@ Replaces direct callback wiring with a decoupled event system.
 """
 
 import asyncio
+import inspect
 import logging
+import sys
 from typing import Any, Callable
 from dataclasses import dataclass
 
@@ -13,29 +15,33 @@ logger = logging.getLogger(__name__)
 
 
 class Topics:
-    """Event topic constants."""
+    """Event topic constants.
+
+    Interned, so handler lookups keyed by these topics hit the identity
+    fast path of string comparison.
+    """
 
     # Plugin events
-    PLUGIN_EVENT = "plugin.event"
+    PLUGIN_EVENT = sys.intern("plugin.event")
 
     # Server events
-    SERVER_ACTION = "server.action"
-    SERVER_CONNECTED = "server.connected"
-    SERVER_DISCONNECTED = "server.disconnected"
-    SERVER_ERROR = "server.error"
+    SERVER_ACTION = sys.intern("server.action")
+    SERVER_CONNECTED = sys.intern("server.connected")
+    SERVER_DISCONNECTED = sys.intern("server.disconnected")
+    SERVER_ERROR = sys.intern("server.error")
 
     # UI connection control events
-    UI_CONNECT_REQUESTED = "ui.connect.requested"
-    UI_DISCONNECT_REQUESTED = "ui.disconnect.requested"
+    UI_CONNECT_REQUESTED = sys.intern("ui.connect.requested")
+    UI_DISCONNECT_REQUESTED = sys.intern("ui.disconnect.requested")
 
     # UI events
-    UI_QUIT_REQUESTED = "ui.quit.requested"
-    UI_SETTINGS_REQUESTED = "ui.settings.requested"
-    UI_SETTINGS_CHANGED = "ui.settings.changed"
+    UI_QUIT_REQUESTED = sys.intern("ui.quit.requested")
+    UI_SETTINGS_REQUESTED = sys.intern("ui.settings.requested")
+    UI_SETTINGS_CHANGED = sys.intern("ui.settings.changed")
 
     # Application lifecycle
-    APP_INITIALIZED = "app.initialized"
-    APP_SHUTDOWN = "app.shutdown"
+    APP_INITIALIZED = sys.intern("app.initialized")
+    APP_SHUTDOWN = sys.intern("app.shutdown")
 
 
 @dataclass
@@ -45,6 +51,22 @@ class Event:
     data: Any = None
 
 
+class _TopicRecord:
+    """Handlers subscribed to a single topic.
+
+    Handler tuples are replaced (never mutated) on subscribe/unsubscribe,
+    so publish can iterate them directly without taking a snapshot.
+    ``count`` is the total number of sync and async handlers.
+    """
+
+    __slots__ = ("sync", "async_", "count")
+
+    def __init__(self):
+        self.sync: tuple[Callable, ...] = ()
+        self.async_: tuple[Callable, ...] = ()
+        self.count = 0
+
+
 class EventBus:
     """
     Simple pub/sub event bus for decoupled communication.
@@ -53,35 +75,49 @@ class EventBus:
     """
 
     def __init__(self):
-        self._sync_handlers: dict[str, list[Callable]] = {}
-        self._async_handlers: dict[str, list[Callable]] = {}
+        # One record per topic, so publish needs a single lookup
+        self._handlers: dict[str, _TopicRecord] = {}
+        # Sorted topic names for get_all_topics(); None when stale
+        self._topics_cache: tuple[str, ...] | None = None
+
+    def _record(self, topic: str) -> _TopicRecord:
+        """Get the handler record for a topic, creating it if needed."""
+        rec = self._handlers.get(topic)
+        if rec is None:
+            rec = self._handlers[topic] = _TopicRecord()
+            self._topics_cache = None
+        return rec
 
     def subscribe(self, topic: str, handler: Callable[[Any], None]) -> None:
         """
         Subscribe a synchronous handler to a topic.
 
+        Subscribing the same handler twice has no effect.
+
         Args:
             topic: Event topic to subscribe to
             handler: Synchronous function to call when event is published
         """
-        if topic not in self._sync_handlers:
-            self._sync_handlers[topic] = []
-
-        self._sync_handlers[topic].append(handler)
+        rec = self._record(topic)
+        if handler not in rec.sync:
+            rec.sync += (handler,)
+            rec.count += 1
         logger.debug(f"Subscribed sync handler to topic: {topic}")
 
     def subscribe_async(self, topic: str, handler: Callable[[Any], None]) -> None:
         """
         Subscribe an asynchronous handler to a topic.
 
+        Subscribing the same handler twice has no effect.
+
         Args:
             topic: Event topic to subscribe to
             handler: Async function to call when event is published
         """
-        if topic not in self._async_handlers:
-            self._async_handlers[topic] = []
-
-        self._async_handlers[topic].append(handler)
+        rec = self._record(topic)
+        if handler not in rec.async_:
+            rec.async_ += (handler,)
+            rec.count += 1
         logger.debug(f"Subscribed async handler to topic: {topic}")
 
     def unsubscribe(self, topic: str, handler: Callable) -> None:
@@ -92,19 +128,25 @@ class EventBus:
             topic: Event topic to unsubscribe from
             handler: Handler to remove
         """
-        if topic in self._sync_handlers:
-            try:
-                self._sync_handlers[topic].remove(handler)
-                logger.debug(f"Unsubscribed sync handler from topic: {topic}")
-            except ValueError:
-                pass
+        rec = self._handlers.get(topic)
+        if rec is None:
+            return
 
-        if topic in self._async_handlers:
-            try:
-                self._async_handlers[topic].remove(handler)
-                logger.debug(f"Unsubscribed async handler from topic: {topic}")
-            except ValueError:
-                pass
+        if handler in rec.sync:
+            rec.sync = tuple(h for h in rec.sync if h != handler)
+            rec.count -= 1
+            logger.debug(f"Unsubscribed sync handler from topic: {topic}")
+
+        if handler in rec.async_:
+            rec.async_ = tuple(h for h in rec.async_ if h != handler)
+            rec.count -= 1
+            logger.debug(f"Unsubscribed async handler from topic: {topic}")
+
+        # Only topics with subscribers keep a record, so publishing to an
+        # unsubscribed topic is a single failed dict lookup
+        if not rec.count:
+            del self._handlers[topic]
+            self._topics_cache = None
 
     def publish(self, topic: str, data: Any = None) -> None:
         """
@@ -114,12 +156,15 @@ class EventBus:
             topic: Event topic
             data: Event data to pass to handlers
         """
-        if topic not in self._sync_handlers:
+        rec = self._handlers.get(topic)
+        if rec is None or not rec.sync:
             return
 
         logger.debug(f"Publishing to topic: {topic}")
 
-        for handler in self._sync_handlers[topic]:
+        # Handlers may (un)subscribe during dispatch; that swaps in a new
+        # tuple and leaves this iteration untouched
+        for handler in rec.sync:
             try:
                 handler(data)
             except Exception as e:
@@ -133,24 +178,29 @@ class EventBus:
             topic: Event topic
             data: Event data to pass to handlers
         """
-        if topic not in self._async_handlers:
+        rec = self._handlers.get(topic)
+        if rec is None or not rec.async_:
             return
 
         logger.debug(f"Publishing async to topic: {topic}")
 
-        # Run all async handlers concurrently
-        tasks = []
-        for handler in self._async_handlers[topic]:
+        # Build the coroutines up front and run them concurrently in one
+        # gather(); a failing handler doesn't cancel its siblings
+        coros = []
+        for handler in rec.async_:
             try:
-                task = asyncio.create_task(handler(data))
-                tasks.append(task)
+                coro = handler(data)
             except Exception as e:
-                logger.error(f"Error creating task for topic '{topic}': {e}")
-
-        # Wait for all handlers to complete
-        if tasks:
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            for i, result in enumerate(results):
+                logger.error(f"Error calling async handler for topic '{topic}': {e}")
+                continue
+            if inspect.isawaitable(coro):
+                coros.append(coro)
+            else:
+                logger.error(f"Async handler for topic '{topic}' did not return an awaitable")
+
+        if coros:
+            results = await asyncio.gather(*coros, return_exceptions=True)
+            for result in results:
                 if isinstance(result, Exception):
                     logger.error(f"Error in async handler for topic '{topic}': {result}")
 
@@ -162,14 +212,12 @@ class EventBus:
             topic: Topic to clear, or None to clear all
         """
         if topic is None:
-            self._sync_handlers.clear()
-            self._async_handlers.clear()
+            self._handlers.clear()
+            self._topics_cache = None
             logger.debug("Cleared all event handlers")
         else:
-            if topic in self._sync_handlers:
-                del self._sync_handlers[topic]
-            if topic in self._async_handlers:
-                del self._async_handlers[topic]
+            if self._handlers.pop(topic, None) is not None:
+                self._topics_cache = None
             logger.debug(f"Cleared handlers for topic: {topic}")
 
     def get_subscriber_count(self, topic: str) -> int:
@@ -182,16 +230,18 @@ class EventBus:
         Returns:
             Total number of subscribers (sync + async)
         """
-        sync_count = len(self._sync_handlers.get(topic, []))
-        async_count = len(self._async_handlers.get(topic, []))
-        return sync_count + async_count
+        rec = self._handlers.get(topic)
+        return rec.count if rec is not None else 0
 
     def get_all_topics(self) -> list[str]:
         """
         Get all topics with subscribers.
 
+        The sorted names are cached until a topic is added or removed.
+
         Returns:
             List of topic names
         """
-        topics = set(self._sync_handlers.keys()) | set(self._async_handlers.keys())
-        return sorted(topics)
+        if self._topics_cache is None:
+            self._topics_cache = tuple(sorted(self._handlers))
+        return list(self._topics_cache)
@@ -0,0 +1,64 @@
+"""JSON helpers for config files with optional orjson acceleration.
+
+orjson is used when installed (``pip install agimate-desktop[speedups]``);
+otherwise the stdlib json module is used. Both backends produce the same
+UTF-8, two-space indented output, so files round-trip between them.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this regardless of the backend in use.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: UTF-8 encoded bytes or str
+
+    Returns:
+        Parsed Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON, e.g. for request bodies.
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_pretty(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON indented with two spaces.
+
+    Args:
+        obj: JSON-serializable object
+        sort_keys: Emit object keys in sorted order for stable output
+
+    Returns:
+        Encoded JSON document
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys).encode("utf-8")
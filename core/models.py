@@ -1,26 +1,76 @@
 """Data models for server communication."""
 
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from typing import Any
-import uuid
+import os
+import threading
+import time
 
+from core import json_utils
 from core.action_types import EVENT_TYPE_DEVICE
 from core.constants import APP_SOURCE_ID
 
+# Random bytes for event ids are read from the OS in batches of 256 ids
+# (hex-encoded) rather than one urandom() call per payload.
+_ID_BATCH = 256
+_id_hex = ""
+_id_pos = 0
+_id_lock = threading.Lock()
+# RFC 4122 variant nibble (10xx) indexed by a random hex digit
+_VARIANT = "89ab" * 4
 
-@dataclass
+
+def _reset_id_buffer() -> None:
+    """Discard buffered random bytes so a forked child never reuses the parent's ids."""
+    global _id_hex, _id_pos, _id_lock
+    _id_hex = ""
+    _id_pos = 0
+    _id_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_buffer)
+
+
+def _new_event_id() -> str:
+    """Return a random (version 4) UUID string."""
+    global _id_hex, _id_pos
+    with _id_lock:
+        if _id_pos >= len(_id_hex):
+            _id_hex = os.urandom(16 * _ID_BATCH).hex()
+            _id_pos = 0
+        h = _id_hex[_id_pos:_id_pos + 32]
+        _id_pos += 32
+    return f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{_VARIANT[int(h[16], 16)]}{h[17:20]}-{h[20:]}"
+
+
+# (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") of the last timestamp;
+# replaced as a whole so concurrent readers never see a mismatched pair
+_ts_prefix: tuple[int, str] = (-1, "")
+
+
+def _utc_now_iso() -> str:
+    """Return the current UTC time as ISO 8601 with microseconds and a Z suffix."""
+    global _ts_prefix
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached = _ts_prefix
+    if cached[0] != sec:
+        cached = _ts_prefix = (sec, time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec)))
+    return f"{cached[1]}.{ns // 1000:06d}Z"
+
+
+@dataclass(slots=True)
 class TriggerPayload:
     """Payload for sending a trigger event to the server."""
 
     name: str                          # Event name (e.g., "desktop.trigger.filewatcher.created")
     data: dict[str, Any]               # Additional event data
     device_id: str                     # Unique device ID
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_event_id)
     type: str = EVENT_TYPE_DEVICE      # Always "DEVICE_EVENT"
     source: str = APP_SOURCE_ID        # Source identifier
     user_id: str | None = None         # User ID (null for device events)
-    occurred_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"))
+    occurred_at: str = field(default_factory=_utc_now_iso)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization (camelCase for server)."""
@@ -35,8 +85,12 @@ class TriggerPayload:
             "data": self.data
         }
 
+    def to_json(self) -> bytes:
+        """Serialize to a compact JSON request body (camelCase for server)."""
+        return json_utils.dumps(self.to_dict())
+
 
-@dataclass
+@dataclass(slots=True)
 class ActionTask:
     """Action task received from the server."""
 
@@ -46,7 +100,6 @@ class ActionTask:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ActionTask":
         """Create from dictionary."""
-        return cls(
-            type=data.get("type", ""),
-            parameters=data.get("parameters", {})
-        )
+        # Positional arguments skip keyword matching in the generated __init__
+        get = data.get
+        return cls(get("type", ""), get("parameters", {}))
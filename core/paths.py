@@ -1,57 +1,81 @@
 """Path utilities for bundled application support."""
 
+import functools
+import os
 import sys
 from pathlib import Path
 
+# Project root when running from source (the directory containing main.py),
+# computed with string operations so no intermediate Path objects are built
+_SOURCE_ROOT = os.path.dirname(os.path.dirname(__file__))
 
+# User data directory (relative to home) for bundled apps, by sys.platform
+_BUNDLED_DATA_SUBDIRS = {
+    'darwin': ('Library', 'Application Support', 'AgimateDesktop'),
+    'win32': ('AppData', 'Local', 'AgimateDesktop'),
+}
+_BUNDLED_DATA_SUBDIR_DEFAULT = ('.config', 'agimatedesktop')
+
+
+@functools.cache
 def get_app_dir() -> Path:
     """Get the application directory.
 
     Returns the directory containing the application files.
     - For bundled app: the temp directory where files are extracted
     - For script: the directory containing main.py
+
+    Resolved once per process.
     """
     if getattr(sys, 'frozen', False):
         # Running as bundled app (PyInstaller)
         return Path(sys._MEIPASS)
     else:
         # Running as script
-        return Path(__file__).parent.parent
+        return Path(_SOURCE_ROOT)
 
 
+@functools.cache
 def get_data_dir() -> Path:
     """Get the user data directory for config and runtime data.
 
     Returns a writable directory for storing user configuration.
     This is separate from app_dir because bundled apps extract to
-    a read-only temp directory.
+    a read-only temp directory. The directory is resolved and created
+    once per process.
     """
     if getattr(sys, 'frozen', False):
         # Bundled: use user's app data directory
-        if sys.platform == 'darwin':
-            data_dir = Path.home() / 'Library' / 'Application Support' / 'AgimateDesktop'
-        elif sys.platform == 'win32':
-            data_dir = Path.home() / 'AppData' / 'Local' / 'AgimateDesktop'
-        else:
-            data_dir = Path.home() / '.config' / 'agimatedesktop'
+        subdir = _BUNDLED_DATA_SUBDIRS.get(sys.platform, _BUNDLED_DATA_SUBDIR_DEFAULT)
+        data_dir = Path.home().joinpath(*subdir)
     else:
         # Script: use script directory
-        data_dir = Path(__file__).parent.parent
+        data_dir = Path(_SOURCE_ROOT)
 
     data_dir.mkdir(parents=True, exist_ok=True)
     return data_dir
 
 
+@functools.cache
 def get_plugins_dir() -> Path:
     """Get the plugins directory."""
     return get_app_dir() / 'plugins'
 
 
+@functools.cache
 def get_config_path() -> Path:
     """Get the main config file path."""
     return get_data_dir() / 'config.json'
 
 
+def _clear_path_caches() -> None:
+    """Drop the cached directories (used by tests)."""
+    get_app_dir.cache_clear()
+    get_data_dir.cache_clear()
+    get_plugins_dir.cache_clear()
+    get_config_path.cache_clear()
+
+
 def is_bundled() -> bool:
     """Check if running as bundled application."""
     return getattr(sys, 'frozen', False)
@@ -7,6 +7,8 @@ from typing import Any, Callable
 import json
 import logging
 
+from core import json_utils
+
 logger = logging.getLogger(__name__)
 
 
@@ -74,8 +76,7 @@ class PluginBase(ABC):
             return self._config
 
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                self._config = json.load(f)
+            self._config = json_utils.loads(self.config_path.read_bytes())
 
             # Validate config values
             valid, error = self.validate_config()
@@ -105,8 +106,7 @@ class PluginBase(ABC):
 
     def save_config(self) -> None:
         """Save plugin configuration to JSON file."""
-        with open(self.config_path, "w", encoding="utf-8") as f:
-            json.dump(self._config, f, indent=2, ensure_ascii=False)
+        self.config_path.write_bytes(json_utils.dumps_pretty(self._config))
 
     def get_config(self, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
@@ -135,6 +135,24 @@ class PluginBase(ABC):
         for handler in self._event_handlers:
             handler(event)
 
+    def emit_events(self, events: list[tuple[str, dict[str, Any] | None]]) -> None:
+        """
+        Emit several events to all registered handlers in one pass.
+
+        Events are built once up front, so handlers receive them in order
+        without paying the per-call overhead of repeated emit_event() calls.
+
+        Args:
+            events: List of (event_name, data) tuples.
+        """
+        built = [
+            PluginEvent(plugin_id=self.plugin_id, event_name=name, data=data or {})
+            for name, data in events
+        ]
+        for handler in self._event_handlers:
+            for event in built:
+                handler(event)
+
     def get_tray_menu_items(self) -> list[TrayMenuItem]:
         """Return menu items for the system tray. Override in subclasses."""
         return []
@@ -10,7 +10,7 @@ from .models import TriggerPayload, ActionTask
 from .plugin_base import PluginEvent, TrayMenuItem, TriggerPlugin, ActionPlugin
 
 if TYPE_CHECKING:
-    from ui.tray import ConnectionStatus
+    from ui.tray_enums import ConnectionStatus
 
 
 @runtime_checkable
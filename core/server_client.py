@@ -217,11 +217,12 @@ class ServerClient:
         return self._http_session
 
     @retry_async(RetryConfig(max_attempts=3, initial_delay=1.0))
-    async def _send_trigger_with_retry(self, url: str, data: dict) -> aiohttp.ClientResponse:
+    async def _send_trigger_with_retry(self, url: str, body: bytes) -> aiohttp.ClientResponse:
         """Internal method that performs HTTP POST with retry logic."""
         session = await self._ensure_http_session()
         timeout = aiohttp.ClientTimeout(total=self._http_timeout)
-        async with session.post(url, json=data, timeout=timeout) as response:
+        # Body is pre-encoded JSON; the session already sends the JSON content type
+        async with session.post(url, data=body, timeout=timeout) as response:
             # Raise for 5xx errors (will trigger retry)
             if response.status >= 500:
                 response.raise_for_status()
@@ -244,7 +245,7 @@ class ServerClient:
         url = f"{self._server_url}{ENDPOINT_DEVICE_TRIGGER}"
 
         try:
-            response = await self._send_trigger_with_retry(url, payload.to_dict())
+            response = await self._send_trigger_with_retry(url, payload.to_json())
             if response.status == 200:
                 logger.info(f"Trigger sent successfully: {payload.name}")
                 return True
@@ -41,16 +41,17 @@ def main():
     # Build DI container
     logger.info("Building DI container...")
     container = ContainerBuilder.build_container(app, loop)
+    components = container.eager_init()
 
     # Create application with dependencies
     logger.info("Creating application...")
     application = Application(
-        config_manager=container.get("config_manager"),
-        device_info=container.get("device_info"),
-        plugin_manager=container.get("plugin_manager"),
-        server_client=container.get("server_client"),
-        tray_manager=container.get("tray_manager"),
-        event_bus=container.get("event_bus"),
+        config_manager=components["config_manager"],
+        device_info=components["device_info"],
+        plugin_manager=components["plugin_manager"],
+        server_client=components["server_client"],
+        tray_manager=components["tray_manager"],
+        event_bus=components["event_bus"],
         app=app,
         loop=loop
     )
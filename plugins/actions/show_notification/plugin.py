@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_SUPPORTED_ACTIONS = frozenset({ACTION_NOTIFICATION, ACTION_NOTIFICATION_MODAL})
+
 
 class ShowNotificationAction(ActionPlugin):
     """Action plugin for showing system and modal notifications."""
@@ -66,7 +68,7 @@ class ShowNotificationAction(ActionPlugin):
             duration: Duration in ms (for system notifications only)
             modal: If True, show modal dialog (alternative to NOTIFICATION_MODAL)
         """
-        if action_type not in [ACTION_NOTIFICATION, ACTION_NOTIFICATION_MODAL]:
+        if action_type not in _SUPPORTED_ACTIONS:
             return False
 
         if self._tray_manager is None:
@@ -3,7 +3,8 @@
 import json
 import logging
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping, NamedTuple
 
 from PySide6.QtWidgets import (
     QDialog,
@@ -30,6 +31,30 @@ from core.plugin_base import TriggerPlugin
 
 logger = logging.getLogger(__name__)
 
+# Read-only default for Button fields, so buttons never share a mutable dict
+_EMPTY_PARAMS: Mapping[str, Any] = MappingProxyType({})
+
+
+class Button(NamedTuple):
+    """Read-only view of a single button entry from config."""
+
+    button_name: str
+    trigger_name: str | None           # None when the config entry has none
+    type: str = "direct"
+    params: Mapping[str, Any] = _EMPTY_PARAMS
+    dialog_params: Mapping[str, Any] = _EMPTY_PARAMS
+
+    @classmethod
+    def from_config(cls, btn_config: dict[str, Any]) -> "Button":
+        """Create from a button dict as stored in config.json."""
+        return cls(
+            button_name=btn_config.get("button_name", ""),
+            trigger_name=btn_config.get("trigger_name"),
+            type=btn_config.get("type", "direct"),
+            params=btn_config.get("params") or {},
+            dialog_params=btn_config.get("dialog_params") or {},
+        )
+
 
 class InputDialog(QDialog):
     """Simple input dialog for button parameters."""
@@ -149,7 +174,7 @@ class VisualButtonsWindow(QDialog):
         grid = QGridLayout(scroll_content)
         grid.setSpacing(10)
 
-        buttons = self.plugin.get_config("buttons", [])
+        buttons = self.plugin.buttons
         columns = self.plugin.get_config("grid_columns", 3)
 
         # Ensure columns is an integer (defensive programming)
@@ -161,15 +186,15 @@ class VisualButtonsWindow(QDialog):
             logger.warning(f"Invalid grid_columns value: {columns}, using default 3")
             columns = 3
 
-        for i, btn_config in enumerate(buttons):
+        for i, button in enumerate(buttons):
             row = i // columns
             col = i % columns
 
-            btn = QPushButton(btn_config.get("button_name", f"Button {i+1}"))
+            btn = QPushButton(button.button_name or f"Button {i+1}")
             btn.setMinimumHeight(50)
             btn.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
             btn.clicked.connect(
-                lambda checked=False, cfg=btn_config: self._on_button_click(cfg)
+                lambda checked=False, b=button: self._on_button_click(b)
             )
             grid.addWidget(btn, row, col)
 
@@ -204,18 +229,19 @@ class VisualButtonsWindow(QDialog):
         layout.addWidget(config_group)
         return widget
 
-    def _on_button_click(self, btn_config: dict[str, Any]) -> None:
+    def _on_button_click(self, button: Button) -> None:
         """Handle button click."""
-        btn_name = btn_config.get("button_name", "")
-        trigger_name = btn_config.get("trigger_name", f"desktop.trigger.visualbuttons.{btn_name}")
-        btn_type = btn_config.get("type", "direct")
-        params = btn_config.get("params", {})
+        btn_name = button.button_name
+        trigger_name = button.trigger_name
+        if trigger_name is None:
+            trigger_name = f"desktop.trigger.visualbuttons.{btn_name}"
+        params = button.params
 
-        logger.info(f"Button clicked: {btn_name}, type: {btn_type}")
+        logger.info(f"Button clicked: {btn_name}, type: {button.type}")
 
-        if btn_type == "dialog":
+        if button.type == "dialog":
             # Show dialog for input
-            dialog_params = btn_config.get("dialog_params", {})
+            dialog_params = button.dialog_params
             input_label = dialog_params.get("input_label", "Input")
             input_type = dialog_params.get("input_type", "text")
 
@@ -261,11 +287,44 @@ class VisualButtonsTrigger(TriggerPlugin):
     def __init__(self, plugin_dir: Path):
         super().__init__(plugin_dir)
         self._window: VisualButtonsWindow | None = None
+        self._buttons: tuple[Button, ...] = ()
 
     @property
     def name(self) -> str:
         return "Visual Buttons"
 
+    @property
+    def buttons(self) -> tuple[Button, ...]:
+        """Configured buttons as read-only records.
+
+        Rebuilt by load_config(), set_config() and save_config(), so
+        repeated access from the UI and capability reporting does no
+        per-key dict work. Changes made in place to the list returned by
+        get_config("buttons") show up after the next set_config() or
+        save_config().
+        """
+        return self._buttons
+
+    def _refresh_buttons(self) -> None:
+        """Rebuild the Button records from the current config."""
+        self._buttons = tuple(Button.from_config(b) for b in self._config.get("buttons", ()))
+
+    def load_config(self) -> dict[str, Any]:
+        """Load configuration and rebuild the buttons."""
+        config = super().load_config()
+        self._refresh_buttons()
+        return config
+
+    def set_config(self, key: str, value: Any) -> None:
+        """Set a configuration value and rebuild the buttons."""
+        super().set_config(key, value)
+        self._refresh_buttons()
+
+    def save_config(self) -> None:
+        """Save configuration and rebuild the buttons (e.g. after the config editor)."""
+        super().save_config()
+        self._refresh_buttons()
+
     def validate_config(self) -> tuple[bool, str]:
         """Validate plugin configuration."""
         # Validate grid_columns
@@ -302,13 +361,13 @@ class VisualButtonsTrigger(TriggerPlugin):
     def get_capabilities(self) -> dict[str, list[str]]:
         """Return visual buttons trigger capabilities based on config."""
         capabilities = {}
-        for btn in self.get_config("buttons", []):
-            trigger_name = btn.get("trigger_name", "")
+        for btn in self.buttons:
+            trigger_name = btn.trigger_name
             if not trigger_name:
                 continue
             params = ["button_name"]
-            params.extend(btn.get("params", {}).keys())
-            if btn.get("type") == "dialog":
+            params.extend(btn.params.keys())
+            if btn.type == "dialog":
                 params.append("input")
             capabilities[trigger_name] = params
         return capabilities
@@ -331,7 +390,7 @@ class VisualButtonsTrigger(TriggerPlugin):
 
     async def initialize(self) -> None:
         """Initialize the plugin."""
-        logger.info(f"VisualButtonsTrigger initialized with {len(self.get_config('buttons', []))} buttons")
+        logger.info(f"VisualButtonsTrigger initialized with {len(self.buttons)} buttons")
 
     async def shutdown(self) -> None:
         """Shutdown the plugin."""
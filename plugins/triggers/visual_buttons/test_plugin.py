@@ -3,9 +3,65 @@
 import pytest
 import json
 from pathlib import Path
-from unittest.mock import Mock, MagicMock, patch
-
-from .plugin import VisualButtonsTrigger
+from unittest.mock import Mock, MagicMock
+
+from .plugin import Button, VisualButtonsTrigger
+
+
+DIRECT_BUTTON = {
+    "button_name": "Direct Button",
+    "trigger_name": "desktop.trigger.visualbuttons.direct",
+    "type": "direct",
+    "params": {"immediate": True}
+}
+
+DIALOG_BUTTON = {
+    "button_name": "Dialog Button",
+    "trigger_name": "desktop.trigger.visualbuttons.dialog",
+    "type": "dialog",
+    "params": {},
+    "dialog_params": {
+        "input_label": "Enter text",
+        "input_type": "textarea",
+        "placeholder": "Type here..."
+    }
+}
+
+MULTI_BUTTONS = [
+    {
+        "button_name": "Button 1",
+        "trigger_name": "desktop.trigger.visualbuttons.1",
+        "type": "direct",
+        "params": {}
+    },
+    {
+        "button_name": "Button 2",
+        "trigger_name": "desktop.trigger.visualbuttons.2",
+        "type": "dialog",
+        "params": {},
+        "dialog_params": {
+            "input_label": "Input",
+            "input_type": "text"
+        }
+    }
+]
+
+
+@pytest.fixture(scope="module")
+def configured_dirs(tmp_path_factory):
+    """Write each read-only sample config once and share it across the module."""
+    base = tmp_path_factory.mktemp("vb_configs")
+    out = {}
+    for name, buttons in (
+        ("direct", [DIRECT_BUTTON]),
+        ("dialog", [DIALOG_BUTTON]),
+        ("multi", MULTI_BUTTONS),
+    ):
+        plugin_dir = base / name
+        plugin_dir.mkdir()
+        (plugin_dir / "config.json").write_text(json.dumps({"enabled": True, "buttons": buttons}))
+        out[name] = plugin_dir
+    return out
 
 
 class TestVisualButtonsInit:
@@ -46,8 +102,8 @@ class TestVisualButtonsInit:
 
         assert plugin.enabled is True
         assert plugin.get_config("grid_columns") == 3
-        assert len(plugin.get_config("buttons")) == 1
-        assert plugin.get_config("buttons")[0]["button_name"] == "Test Button"
+        assert len(plugin.buttons) == 1
+        assert plugin.buttons[0].button_name == "Test Button"
 
 
 class TestVisualButtonsLifecycle:
@@ -117,44 +173,17 @@ class TestButtonConfiguration:
         plugin = VisualButtonsTrigger(plugin_dir)
         plugin.load_config()
 
-        buttons = plugin.get_config("buttons", [])
-        assert buttons == []
+        assert plugin.buttons == ()
 
-    def test_load_multiple_buttons(self, tmp_path):
+    def test_load_multiple_buttons(self, configured_dirs):
         """Test loading multiple buttons."""
-        plugin_dir = tmp_path / "visual_buttons"
-        plugin_dir.mkdir()
-
-        config = {
-            "enabled": True,
-            "buttons": [
-                {
-                    "button_name": "Button 1",
-                    "trigger_name": "desktop.trigger.visualbuttons.1",
-                    "type": "direct",
-                    "params": {}
-                },
-                {
-                    "button_name": "Button 2",
-                    "trigger_name": "desktop.trigger.visualbuttons.2",
-                    "type": "dialog",
-                    "params": {},
-                    "dialog_params": {
-                        "input_label": "Input",
-                        "input_type": "text"
-                    }
-                }
-            ]
-        }
-        (plugin_dir / "config.json").write_text(json.dumps(config))
-
-        plugin = VisualButtonsTrigger(plugin_dir)
+        plugin = VisualButtonsTrigger(configured_dirs["multi"])
         plugin.load_config()
 
-        buttons = plugin.get_config("buttons")
+        buttons = plugin.buttons
         assert len(buttons) == 2
-        assert buttons[0]["type"] == "direct"
-        assert buttons[1]["type"] == "dialog"
+        assert buttons[0].type == "direct"
+        assert buttons[1].type == "dialog"
 
     def test_default_grid_columns(self, tmp_path):
         """Test default grid columns value."""
@@ -180,21 +209,20 @@ class TestButtonWindow:
 
         assert plugin.has_window() is True
 
-    def test_create_window(self, tmp_path):
+    def test_create_window(self, tmp_path, monkeypatch):
         """Test create_window() creates window."""
         plugin_dir = tmp_path / "visual_buttons"
         plugin_dir.mkdir()
 
         plugin = VisualButtonsTrigger(plugin_dir)
 
-        with patch('plugins.triggers.visual_buttons.plugin.VisualButtonsWindow') as MockWindow:
-            mock_window = MagicMock()
-            MockWindow.return_value = mock_window
+        MockWindow = MagicMock()
+        monkeypatch.setattr("plugins.triggers.visual_buttons.plugin.VisualButtonsWindow", MockWindow)
 
-            window = plugin.create_window()
+        window = plugin.create_window()
 
-            assert window is not None
-            MockWindow.assert_called_once_with(plugin, None)
+        assert window is not None
+        MockWindow.assert_called_once_with(plugin, None)
 
 
 
@@ -237,6 +265,28 @@ class TestEventEmission:
         assert len(events_received) == 1
         assert events_received[0].data["user_input"] == "Test note content"
 
+    def test_emit_button_events_batch(self, tmp_path):
+        """Test emitting several button events in one batch."""
+        plugin_dir = tmp_path / "visual_buttons"
+        plugin_dir.mkdir()
+
+        plugin = VisualButtonsTrigger(plugin_dir)
+
+        events_received = []
+        plugin.on_event(lambda e: events_received.append(e))
+
+        plugin.emit_events([
+            ("desktop.trigger.visualbuttons.test", {"button": "test"}),
+            ("desktop.trigger.visualbuttons.note", None),
+        ])
+
+        assert [e.event_name for e in events_received] == [
+            "desktop.trigger.visualbuttons.test",
+            "desktop.trigger.visualbuttons.note",
+        ]
+        assert events_received[0].data == {"button": "test"}
+        assert events_received[1].data == {}
+
 
 class TestTrayMenuItems:
     """Test cases for tray menu items."""
@@ -257,61 +307,19 @@ class TestTrayMenuItems:
 class TestButtonTypes:
     """Test cases for different button types."""
 
-    def test_direct_button_config(self, tmp_path):
-        """Test direct button configuration."""
-        plugin_dir = tmp_path / "visual_buttons"
-        plugin_dir.mkdir()
-
-        config = {
-            "enabled": True,
-            "buttons": [
-                {
-                    "button_name": "Direct Button",
-                    "trigger_name": "desktop.trigger.visualbuttons.direct",
-                    "type": "direct",
-                    "params": {"immediate": True}
-                }
-            ]
-        }
-        (plugin_dir / "config.json").write_text(json.dumps(config))
-
-        plugin = VisualButtonsTrigger(plugin_dir)
+    @pytest.mark.parametrize("config_name,expected_type,section,key,expected_value", [
+        ("direct", "direct", "params", "immediate", True),
+        ("dialog", "dialog", "dialog_params", "input_label", "Enter text"),
+        ("dialog", "dialog", "dialog_params", "input_type", "textarea"),
+    ], ids=["direct", "dialog-label", "dialog-input-type"])
+    def test_button_config(self, configured_dirs, config_name, expected_type, section, key, expected_value):
+        """Test loading a single button of each type."""
+        plugin = VisualButtonsTrigger(configured_dirs[config_name])
         plugin.load_config()
 
-        button = plugin.get_config("buttons")[0]
-        assert button["type"] == "direct"
-        assert button["params"]["immediate"] is True
-
-    def test_dialog_button_config(self, tmp_path):
-        """Test dialog button configuration."""
-        plugin_dir = tmp_path / "visual_buttons"
-        plugin_dir.mkdir()
-
-        config = {
-            "enabled": True,
-            "buttons": [
-                {
-                    "button_name": "Dialog Button",
-                    "trigger_name": "desktop.trigger.visualbuttons.dialog",
-                    "type": "dialog",
-                    "params": {},
-                    "dialog_params": {
-                        "input_label": "Enter text",
-                        "input_type": "textarea",
-                        "placeholder": "Type here..."
-                    }
-                }
-            ]
-        }
-        (plugin_dir / "config.json").write_text(json.dumps(config))
-
-        plugin = VisualButtonsTrigger(plugin_dir)
-        plugin.load_config()
-
-        button = plugin.get_config("buttons")[0]
-        assert button["type"] == "dialog"
-        assert button["dialog_params"]["input_label"] == "Enter text"
-        assert button["dialog_params"]["input_type"] == "textarea"
+        button = plugin.buttons[0]
+        assert button.type == expected_type
+        assert getattr(button, section)[key] == expected_value
 
 
 class TestConfigPersistence:
@@ -340,9 +348,9 @@ class TestConfigPersistence:
         plugin2 = VisualButtonsTrigger(plugin_dir)
         plugin2.load_config()
 
-        loaded_buttons = plugin2.get_config("buttons")
+        loaded_buttons = plugin2.buttons
         assert len(loaded_buttons) == 1
-        assert loaded_buttons[0]["button_name"] == "New Button"
+        assert loaded_buttons[0].button_name == "New Button"
 
     def test_update_grid_columns(self, tmp_path):
         """Test updating grid columns configuration."""
@@ -358,3 +366,61 @@ class TestConfigPersistence:
         plugin2.load_config()
 
         assert plugin2.get_config("grid_columns") == 4
+
+    def test_buttons_refresh_after_set_config(self, tmp_path):
+        """Test buttons view is rebuilt when the buttons list is replaced."""
+        plugin_dir = tmp_path / "visual_buttons"
+        plugin_dir.mkdir()
+
+        plugin = VisualButtonsTrigger(plugin_dir)
+        assert plugin.buttons == ()
+
+        plugin.set_config("buttons", [
+            {"button_name": "A", "trigger_name": "desktop.trigger.visualbuttons.a", "type": "direct"}
+        ])
+
+        assert plugin.buttons[0].button_name == "A"
+        assert plugin.buttons[0].params == {}
+        assert plugin.buttons is plugin.buttons
+
+    def test_buttons_refresh_after_save_config(self, tmp_path):
+        """Test in-place edits (e.g. from the config editor) show up after save_config()."""
+        plugin_dir = tmp_path / "visual_buttons"
+        plugin_dir.mkdir()
+
+        plugin = VisualButtonsTrigger(plugin_dir)
+        plugin.set_config("buttons", [])
+
+        plugin.get_config("buttons").append(
+            {"button_name": "A", "trigger_name": "desktop.trigger.visualbuttons.a", "type": "direct"}
+        )
+        plugin.save_config()
+
+        assert [b.button_name for b in plugin.buttons] == ["A"]
+
+    def test_capabilities_skip_buttons_without_trigger_name(self, tmp_path):
+        """Test get_capabilities() doesn't invent names for buttons lacking trigger_name."""
+        plugin_dir = tmp_path / "visual_buttons"
+        plugin_dir.mkdir()
+
+        plugin = VisualButtonsTrigger(plugin_dir)
+        plugin.set_config("buttons", [
+            {"button_name": "Named", "trigger_name": "desktop.trigger.visualbuttons.named", "type": "dialog"},
+            {"button_name": "Unnamed", "type": "direct"},
+        ])
+
+        assert plugin.buttons[1].trigger_name is None
+        assert plugin.get_capabilities() == {
+            "desktop.trigger.visualbuttons.named": ["button_name", "input"],
+        }
+
+    def test_button_default_params_not_shared(self):
+        """Test Button defaults cannot be mutated into other buttons."""
+        a = Button("A", "desktop.trigger.visualbuttons.a")
+        b = Button("B", "desktop.trigger.visualbuttons.b")
+
+        with pytest.raises(TypeError):
+            a.params["leak"] = True
+
+        assert b.params == {}
+        assert b.dialog_params == {}
@@ -1,8 +1,16 @@
 """Shared pytest fixtures for Agimate Desktop tests."""
 
 import pytest
+import logging
 from pathlib import Path
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from unittest.mock import MagicMock, AsyncMock, NonCallableMock
+
+
+# Mock plugins are loaded by PluginManager from disk, never collected as tests
+collect_ignore_glob = ["fixtures/mock_plugins/**/plugin.py"]
+
+logger = logging.getLogger(__name__)
 
 
 @pytest.fixture
@@ -40,9 +48,9 @@ def mock_frozen(monkeypatch):
     return _mock_frozen
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_trigger_payload():
-    """Provide a sample TriggerPayload for testing."""
+    """Provide a sample TriggerPayload for testing (shared; do not mutate)."""
     from core.models import TriggerPayload
     return TriggerPayload(
         name="device.test.event",
@@ -51,11 +59,165 @@ def sample_trigger_payload():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_action_task():
-    """Provide a sample ActionTask for testing."""
+    """Provide a sample ActionTask for testing (shared; do not mutate)."""
     from core.models import ActionTask
     return ActionTask(
         type="desktop.action.notification.show",
         parameters={"title": "Test", "message": "Test message"}
     )
+
+
+@pytest.fixture(scope="session")
+def sample_plugin_event():
+    """Provide a sample PluginEvent for testing (shared; do not mutate)."""
+    from core.plugin_base import PluginEvent
+    return PluginEvent(
+        plugin_id="test-plugin",
+        event_name="test.event",
+        data={"key": "value"}
+    )
+
+
+class FakeEventBus:
+    """Minimal stand-in for EventBus that records subscriptions.
+
+    Handlers are called inline on publish; like EventBus, handler errors
+    are logged rather than propagated to the publisher.
+    """
+
+    def __init__(self):
+        self._sync_handlers: dict[str, list] = {}
+        self._async_handlers: dict[str, list] = {}
+
+    def subscribe(self, topic, handler):
+        self._sync_handlers.setdefault(topic, []).append(handler)
+
+    def subscribe_async(self, topic, handler):
+        self._async_handlers.setdefault(topic, []).append(handler)
+
+    def publish(self, topic, data=None):
+        for handler in self._sync_handlers.get(topic, ()):
+            try:
+                handler(data)
+            except Exception as e:
+                logger.error(f"Error in sync handler for topic '{topic}': {e}")
+
+
+def _make_stub(methods=(), async_methods=(), **attrs):
+    """Build a SimpleNamespace stub with mock leaves only where needed.
+
+    Args:
+        methods: Names to expose as MagicMock leaves
+        async_methods: Names to expose as AsyncMock leaves
+        **attrs: Plain attribute values
+
+    Returns:
+        Stub whose other attribute lookups raise AttributeError
+    """
+    stub = SimpleNamespace(**attrs)
+    for name in methods:
+        setattr(stub, name, MagicMock())
+    for name in async_methods:
+        setattr(stub, name, AsyncMock())
+    return stub
+
+
+def _configure_mock_deps(deps):
+    """Apply the default return values and attributes to Application mock dependencies."""
+    deps["config_manager"].get.return_value = True
+    deps["config_manager"].device_id = "test-device"
+    deps["device_info"].device_id = "test-device"
+    deps["plugin_manager"].actions = {}
+    deps["plugin_manager"].get_all_tray_items.return_value = []
+    deps["plugin_manager"].get_failed_plugins.return_value = {}
+    deps["plugin_manager"].get_capabilities.return_value = {
+        "triggers": {"desktop.trigger.mock.triggered": {"params": ["test"]}},
+        "actions": {"MOCK_ACTION": {"params": ["param1"]}},
+    }
+    deps["server_client"].link_device.return_value = True
+
+
+@pytest.fixture(scope="session")
+def _mock_deps_template():
+    """Build Application mock dependencies once per session.
+
+    Returns (deps, originals) where originals maps each dependency to the
+    attributes it was built with, so they can be restored before each test.
+    Under pytest-xdist each worker process builds its own template.
+    """
+    config_manager = MagicMock()
+
+    device_info = MagicMock()
+
+    plugin_manager = _make_stub(
+        methods=["discover_plugins", "get_capabilities", "get_all_tray_items", "get_failed_plugins"],
+        async_methods=["initialize_all", "start_triggers", "shutdown_all", "execute_action"],
+    )
+
+    server_client = _make_stub(
+        async_methods=["send_trigger", "link_device", "connect", "disconnect", "close"],
+    )
+
+    tray_manager = _make_stub(
+        methods=["show", "hide", "set_plugin_items", "set_connection_status"],
+    )
+
+    app = MagicMock()
+    app.quit = MagicMock()
+
+    loop = MagicMock()
+    loop.call_soon = MagicMock()
+
+    deps = {
+        "config_manager": config_manager,
+        "device_info": device_info,
+        "plugin_manager": plugin_manager,
+        "server_client": server_client,
+        "tray_manager": tray_manager,
+        "app": app,
+        "loop": loop
+    }
+    _configure_mock_deps(deps)
+
+    # Tests may replace attributes (e.g. link_device = AsyncMock(...)),
+    # which reset_mock() does not undo
+    originals = {
+        name: {
+            attr: value
+            for attr, value in vars(dep).items()
+            if not attr.startswith("_") and attr != "method_calls"
+        }
+        for name, dep in deps.items()
+    }
+    return deps, originals
+
+
+@pytest.fixture(scope="session")
+def mock_deps_factory(_mock_deps_template):
+    """Return a callable giving a fresh dict of the shared mock dependencies.
+
+    Each call restores rebound attributes, resets call history and side
+    effects, re-applies the default return values and adds a new
+    FakeEventBus.
+    """
+    deps, originals = _mock_deps_template
+
+    def fresh():
+        for name, dep in deps.items():
+            if isinstance(dep, SimpleNamespace):
+                vars(dep).clear()
+                vars(dep).update(originals[name])
+                for leaf in vars(dep).values():
+                    if isinstance(leaf, NonCallableMock):
+                        leaf.reset_mock(side_effect=True)
+            else:
+                for attr, value in originals[name].items():
+                    setattr(dep, attr, value)
+                dep.reset_mock(side_effect=True)
+        _configure_mock_deps(deps)
+        # The event bus carries subscriber state, so it is never shared
+        return {**deps, "event_bus": FakeEventBus()}
+
+    return fresh
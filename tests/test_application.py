@@ -2,74 +2,166 @@
 
 import pytest
 import asyncio
+import contextlib
+import logging
+import subprocess
+import sys
+import types
+from pathlib import Path
 from unittest.mock import MagicMock, AsyncMock, patch, call
 
 from core.application import Application
 from core.event_bus import EventBus, Topics
-from core.plugin_base import PluginEvent
-from core.models import ActionTask
-from ui.tray import ConnectionStatus
+from ui.tray_enums import ConnectionStatus
+
+
+# Topics Application must subscribe to on construction
+_EXPECTED_SYNC_TOPICS = frozenset({
+    Topics.PLUGIN_EVENT,
+    Topics.SERVER_ACTION,
+    Topics.UI_QUIT_REQUESTED,
+    Topics.UI_SETTINGS_REQUESTED,
+    Topics.UI_SETTINGS_CHANGED,
+})
+
+_EXPECTED_CONNECTION_TOPICS = frozenset({
+    Topics.SERVER_CONNECTED,
+    Topics.SERVER_DISCONNECTED,
+    Topics.SERVER_ERROR,
+    Topics.UI_CONNECT_REQUESTED,
+    Topics.UI_DISCONNECT_REQUESTED,
+})
+
+
+async def _noop(*_args, **_kwargs):
+    """Async stand-in for coroutines whose calls a test does not inspect."""
+
+
+def _config_side_effect(mapping):
+    """Build a config_manager.get side effect that looks keys up in mapping."""
+    return lambda key, default=None: mapping.get(key, default)
+
+
+def _one_tick(application):
+    """Patch asyncio.sleep so Application.run() leaves its loop after one iteration."""
+    return patch(
+        "asyncio.sleep",
+        AsyncMock(side_effect=lambda *_: setattr(application, "_running", False)),
+    )
+
+
+def _invoke(application, topic, payload=None):
+    """Call Application's handlers for topic directly, bypassing publish()."""
+    for handler in application.event_bus._sync_handlers[topic]:
+        handler(payload)
+
+
+@contextlib.contextmanager
+def _capture_tasks():
+    """Record the tasks Application schedules so a test can await them directly."""
+    tasks = []
+
+    def create_task(coro):
+        task = asyncio.ensure_future(coro)
+        tasks.append(task)
+        return task
+
+    with patch("core.application.asyncio.create_task", side_effect=create_task):
+        yield tasks
+
+
+@pytest.fixture
+def mock_dependencies(mock_deps_factory):
+    """Provide the shared mock dependencies, reset to their defaults."""
+    return mock_deps_factory()
+
+
+@pytest.fixture
+def status_recorder(mock_dependencies):
+    """Record the statuses passed to tray_manager.set_connection_status, in order."""
+    statuses = []
+    mock_dependencies["tray_manager"].set_connection_status = statuses.append
+    return statuses
+
+
+@pytest.fixture(scope="class")
+def class_application(mock_deps_factory):
+    """Build one Application, and subscribe its handlers, once per test class."""
+    deps = mock_deps_factory()
+    return Application(**deps), deps
+
+
+@pytest.fixture
+def app_and_deps(class_application, mock_deps_factory):
+    """Provide the class-shared Application with its state and mocks reset.
+
+    Tests that need a different set of dependencies (e.g. plugin_manager
+    set to None) should build their own Application from mock_dependencies.
+    """
+    application, deps = class_application
+    mock_deps_factory()
+    application.plugin_manager = deps["plugin_manager"]
+    application.server_client = deps["server_client"]
+    application._running = False
+    application._background_tasks.clear()
+    return application, deps
+
+
+@pytest.fixture(autouse=True, scope="class")
+def _patch_settings_window():
+    """Keep SettingsWindow patched for each test class so no real dialog opens.
+
+    A stand-in ui.settings module is installed so the deferred import in
+    Application picks up the mock without loading Qt.
+    """
+    settings_window_cls = MagicMock()
+    settings_module = types.ModuleType("ui.settings")
+    settings_module.SettingsWindow = settings_window_cls
+    with patch.dict(sys.modules, {"ui.settings": settings_module}):
+        yield settings_window_cls
+
+
+@pytest.fixture
+def mock_settings_window(_patch_settings_window):
+    """Provide the patched SettingsWindow class with its call history reset."""
+    _patch_settings_window.reset_mock()
+    return _patch_settings_window
+
+
+class _StubServerClient:
+    """Stand-in for ServerClient that records the instances Application creates."""
+
+    instances: list["_StubServerClient"] = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.link_device = AsyncMock(return_value=True)
+        self.connect = AsyncMock()
+        self.on_action = MagicMock()
+        self.instances.append(self)
 
 
 @pytest.fixture
-def mock_dependencies():
-    """Create mock dependencies for Application."""
-    config_manager = MagicMock()
-    config_manager.get.return_value = True
-    config_manager.device_id = "test-device"
-
-    device_info = MagicMock()
-    device_info.device_id = "test-device"
-
-    plugin_manager = MagicMock()
-    plugin_manager.actions = {}
-    plugin_manager.get_all_tray_items = MagicMock(return_value=[])
-    plugin_manager.get_failed_plugins = MagicMock(return_value={})
-    plugin_manager.discover_plugins = MagicMock()
-    plugin_manager.initialize_all = AsyncMock()
-    plugin_manager.start_triggers = AsyncMock()
-    plugin_manager.shutdown_all = AsyncMock()
-    plugin_manager.execute_action = AsyncMock()
-    plugin_manager.get_capabilities = MagicMock(return_value={
-        "triggers": {"desktop.trigger.mock.triggered": {"params": ["test"]}},
-        "actions": {"MOCK_ACTION": {"params": ["param1"]}},
-    })
-
-    server_client = MagicMock()
-    server_client.send_trigger = AsyncMock()
-    server_client.link_device = AsyncMock(return_value=True)
-    server_client.connect = AsyncMock()
-    server_client.disconnect = AsyncMock()
-    server_client.close = AsyncMock()
-
-    tray_manager = MagicMock()
-    tray_manager.show = MagicMock()
-    tray_manager.hide = MagicMock()
-    tray_manager.set_plugin_items = MagicMock()
-    tray_manager.set_connection_status = MagicMock()
-
-    event_bus = EventBus()
-
-    app = MagicMock()
-    app.quit = MagicMock()
-
-    loop = MagicMock()
-
-    return {
-        "config_manager": config_manager,
-        "device_info": device_info,
-        "plugin_manager": plugin_manager,
-        "server_client": server_client,
-        "tray_manager": tray_manager,
-        "event_bus": event_bus,
-        "app": app,
-        "loop": loop
-    }
+def stub_server_client_cls(monkeypatch):
+    """Replace ServerClient (imported lazily by Application) with _StubServerClient."""
+    _StubServerClient.instances.clear()
+    monkeypatch.setattr("core.server_client.ServerClient", _StubServerClient)
+    return _StubServerClient
 
 
 class TestApplicationInit:
     """Tests for Application initialization."""
 
+    def test_import_does_not_load_qt(self):
+        """Test importing core.application doesn't load PySide6."""
+        result = subprocess.run(
+            [sys.executable, "-c",
+             "import sys, core.application; sys.exit('PySide6' in sys.modules)"],
+            cwd=Path(__file__).parent.parent,
+        )
+
+        assert result.returncode == 0
+
     def test_init(self, mock_dependencies):
         """Test Application initialization."""
         application = Application(**mock_dependencies)
@@ -89,93 +181,101 @@ class TestApplicationInit:
         application = Application(**mock_dependencies)
 
         # Check that handlers are registered
-        assert Topics.PLUGIN_EVENT in event_bus._sync_handlers
-        assert Topics.SERVER_ACTION in event_bus._sync_handlers
-        assert Topics.UI_QUIT_REQUESTED in event_bus._sync_handlers
-        assert Topics.UI_SETTINGS_REQUESTED in event_bus._sync_handlers
-        assert Topics.UI_SETTINGS_CHANGED in event_bus._sync_handlers
+        assert _EXPECTED_SYNC_TOPICS.issubset(event_bus._sync_handlers)
+
+    def test_routes_events_through_real_event_bus(self, mock_dependencies):
+        """Test Application handlers are reachable through a real EventBus."""
+        mock_dependencies["event_bus"] = EventBus()
+        application = Application(**mock_dependencies)
+
+        application.event_bus.publish(Topics.SERVER_CONNECTED, None)
+
+        mock_dependencies["tray_manager"].set_connection_status.assert_called_once_with(
+            ConnectionStatus.CONNECTED
+        )
 
 
 class TestApplicationEventHandling:
     """Tests for Application event handling."""
 
-    def test_handle_plugin_event(self, mock_dependencies):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_handle_plugin_event(self, app_and_deps, sample_plugin_event):
         """Test handling plugin events."""
-        application = Application(**mock_dependencies)
-
-        plugin_event = PluginEvent(
-            plugin_id="test-plugin",
-            event_name="test.event",
-            data={"key": "value"}
-        )
+        application, deps = app_and_deps
 
-        # Publish event
-        application.event_bus.publish(Topics.PLUGIN_EVENT, plugin_event)
+        # Handle event and run the scheduled task
+        with _capture_tasks() as tasks:
+            _invoke(application, Topics.PLUGIN_EVENT, sample_plugin_event)
+        await tasks[0]
 
-        # Should call send_trigger
-        mock_dependencies["server_client"].send_trigger.assert_called_once()
+        # Should send trigger
+        assert deps["server_client"].send_trigger.await_count == 1
 
-    def test_handle_server_action(self, mock_dependencies):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_handle_server_action(self, app_and_deps, sample_action_task):
         """Test handling server actions."""
-        application = Application(**mock_dependencies)
+        application, deps = app_and_deps
 
-        action = ActionTask(
-            type="TEST_ACTION",
-            parameters={"key": "value"}
-        )
-
-        # Publish event
-        application.event_bus.publish(Topics.SERVER_ACTION, action)
+        # Handle event and run the scheduled task
+        with _capture_tasks() as tasks:
+            _invoke(application, Topics.SERVER_ACTION, sample_action_task)
+        await tasks[0]
 
-        # Should call execute_action
-        mock_dependencies["plugin_manager"].execute_action.assert_called_once()
+        # Should execute action
+        deps["plugin_manager"].execute_action.assert_awaited_once_with(
+            sample_action_task.type, sample_action_task.parameters
+        )
 
-    def test_handle_quit_request(self, mock_dependencies):
+    def test_handle_quit_request(self, app_and_deps):
         """Test handling quit request."""
-        application = Application(**mock_dependencies)
+        application, deps = app_and_deps
         application._running = True
 
         # Mock loop.call_soon
         call_soon_mock = MagicMock()
         application.loop.call_soon = call_soon_mock
 
-        # Publish event
-        application.event_bus.publish(Topics.UI_QUIT_REQUESTED, None)
+        # Handle event
+        _invoke(application, Topics.UI_QUIT_REQUESTED)
 
         # Should stop running and call quit
         assert application._running is False
-        call_soon_mock.assert_called_once()
+        assert call_soon_mock.call_count == 1
 
-    def test_handle_settings_request(self, mock_dependencies):
+    def test_handle_settings_request(self, app_and_deps, mock_settings_window):
         """Test handling settings request."""
-        application = Application(**mock_dependencies)
-
-        with patch("core.application.SettingsWindow") as MockSettingsWindow:
-            mock_window = MagicMock()
-            MockSettingsWindow.return_value = mock_window
+        application, deps = app_and_deps
 
-            # Publish event
-            application.event_bus.publish(Topics.UI_SETTINGS_REQUESTED, None)
+        # Handle event
+        _invoke(application, Topics.UI_SETTINGS_REQUESTED)
 
-            # Should create and show settings window
-            MockSettingsWindow.assert_called_once()
-            mock_window.exec.assert_called_once()
+        # Should create and show settings window
+        assert mock_settings_window.call_count == 1
+        assert mock_settings_window.return_value.exec.call_count == 1
 
-    def test_handle_settings_changed(self, mock_dependencies):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_handle_settings_changed(self, app_and_deps):
         """Test handling settings changed."""
-        application = Application(**mock_dependencies)
+        application, deps = app_and_deps
+        # Keep the root log level as it is
+        deps["config_manager"].get.side_effect = _config_side_effect({
+            "log_level": logging.getLevelName(logging.getLogger().level),
+        })
 
-        # Publish event
-        application.event_bus.publish(Topics.UI_SETTINGS_CHANGED, None)
+        # Handle event
+        with _capture_tasks() as tasks:
+            _invoke(application, Topics.UI_SETTINGS_CHANGED)
 
-        # Should reload config
-        mock_dependencies["config_manager"].load.assert_called_once()
+        # Should reload config and schedule a reconnect (not run here)
+        assert deps["config_manager"].load.call_count == 1
+        assert len(tasks) == 1
+        tasks[0].cancel()
 
 
 class TestApplicationLifecycle:
     """Tests for Application lifecycle."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_initialize(self, mock_dependencies):
         """Test Application initialization."""
         application = Application(**mock_dependencies)
@@ -183,13 +283,13 @@ class TestApplicationLifecycle:
         await application.initialize()
 
         # Should initialize plugin manager
-        mock_dependencies["plugin_manager"].discover_plugins.assert_called_once()
-        mock_dependencies["plugin_manager"].initialize_all.assert_called_once()
+        assert mock_dependencies["plugin_manager"].discover_plugins.call_count == 1
+        assert mock_dependencies["plugin_manager"].initialize_all.call_count == 1
 
         # Should show tray
-        mock_dependencies["tray_manager"].show.assert_called_once()
+        assert mock_dependencies["tray_manager"].show.call_count == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_initialize_without_plugins(self, mock_dependencies):
         """Test initialization without plugin manager."""
         mock_dependencies["plugin_manager"] = None
@@ -199,9 +299,9 @@ class TestApplicationLifecycle:
         await application.initialize()
 
         # Should still show tray
-        mock_dependencies["tray_manager"].show.assert_called_once()
+        assert mock_dependencies["tray_manager"].show.call_count == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_initialize_plugin_failure(self, mock_dependencies):
         """Test initialization with plugin failures."""
         mock_dependencies["plugin_manager"].initialize_all.side_effect = Exception("Plugin error")
@@ -212,47 +312,39 @@ class TestApplicationLifecycle:
         # Should handle error gracefully
         assert application.plugin_manager is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_run_starts_triggers(self, mock_dependencies):
         """Test that run starts triggers."""
         application = Application(**mock_dependencies)
 
-        # Patch initialize and asyncio.sleep to exit immediately
-        with patch.object(application, "initialize", new_callable=AsyncMock), \
-             patch("asyncio.sleep", side_effect=[None, Exception("Exit loop")]):
-            try:
-                await application.run()
-            except Exception as e:
-                if str(e) != "Exit loop":
-                    raise
+        # Skip initialize and let the run loop exit after one tick
+        with patch.object(application, "initialize", _noop), \
+             _one_tick(application):
+            await application.run()
 
             # Should start triggers
-            mock_dependencies["plugin_manager"].start_triggers.assert_called_once()
+            assert mock_dependencies["plugin_manager"].start_triggers.call_count == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_run_connects_to_server(self, mock_dependencies):
         """Test that run links device and connects to server."""
-        mock_dependencies["config_manager"].get.side_effect = lambda key, default=None: {
+        mock_dependencies["config_manager"].get.side_effect = _config_side_effect({
             "auto_connect": True,
             "device_key": "test-api-key",
-        }.get(key, default)
+        })
 
         application = Application(**mock_dependencies)
 
-        # Patch initialize and asyncio.sleep to exit immediately
-        with patch.object(application, "initialize", new_callable=AsyncMock), \
-             patch("asyncio.sleep", side_effect=[None, Exception("Exit loop")]):
-            try:
-                await application.run()
-            except Exception as e:
-                if str(e) != "Exit loop":
-                    raise
+        # Skip initialize and let the run loop exit after one tick
+        with patch.object(application, "initialize", _noop), \
+             _one_tick(application):
+            await application.run()
 
             # Should link device first, then connect
-            mock_dependencies["server_client"].link_device.assert_called_once()
-            mock_dependencies["server_client"].connect.assert_called_once()
+            assert mock_dependencies["server_client"].link_device.call_count == 1
+            assert mock_dependencies["server_client"].connect.call_count == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_shutdown(self, mock_dependencies):
         """Test Application shutdown."""
         application = Application(**mock_dependencies)
@@ -260,18 +352,18 @@ class TestApplicationLifecycle:
         await application._shutdown()
 
         # Should hide tray
-        mock_dependencies["tray_manager"].hide.assert_called_once()
+        assert mock_dependencies["tray_manager"].hide.call_count == 1
 
         # Should close server
-        mock_dependencies["server_client"].close.assert_called_once()
+        assert mock_dependencies["server_client"].close.call_count == 1
 
         # Should shutdown plugins
-        mock_dependencies["plugin_manager"].shutdown_all.assert_called_once()
+        assert mock_dependencies["plugin_manager"].shutdown_all.call_count == 1
 
         # Should quit app
-        mock_dependencies["app"].quit.assert_called_once()
+        assert mock_dependencies["app"].quit.call_count == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_shutdown_without_plugins(self, mock_dependencies):
         """Test shutdown without plugin manager."""
         mock_dependencies["plugin_manager"] = None
@@ -281,42 +373,46 @@ class TestApplicationLifecycle:
         await application._shutdown()
 
         # Should still quit app
-        mock_dependencies["app"].quit.assert_called_once()
+        assert mock_dependencies["app"].quit.call_count == 1
 
 
 class TestApplicationPluginCoordination:
     """Tests for Application plugin coordination."""
 
-    def test_setup_notification_plugin(self, mock_dependencies):
+    def test_setup_notification_plugin(self, app_and_deps):
         """Test setting up notification plugin."""
+        application, deps = app_and_deps
+
         # Create mock action with set_tray_manager
         mock_action = MagicMock()
         mock_action.set_tray_manager = MagicMock()
 
-        mock_dependencies["plugin_manager"].actions = {"notification": mock_action}
+        deps["plugin_manager"].actions = {"notification": mock_action}
 
-        application = Application(**mock_dependencies)
         application._setup_notification_plugin()
 
         # Should call set_tray_manager
         mock_action.set_tray_manager.assert_called_once_with(
-            mock_dependencies["tray_manager"]
+            deps["tray_manager"]
         )
 
-    def test_update_tray_menu(self, mock_dependencies):
+    def test_update_tray_menu(self, app_and_deps):
         """Test updating tray menu."""
+        application, deps = app_and_deps
+
         mock_items = [MagicMock(), MagicMock()]
-        mock_dependencies["plugin_manager"].get_all_tray_items.return_value = mock_items
+        deps["plugin_manager"].get_all_tray_items.return_value = mock_items
 
-        application = Application(**mock_dependencies)
         application._update_tray_menu()
 
         # Should get items and set them
-        mock_dependencies["plugin_manager"].get_all_tray_items.assert_called_once()
-        mock_dependencies["tray_manager"].set_plugin_items.assert_called_once_with(mock_items)
+        assert deps["plugin_manager"].get_all_tray_items.call_count == 1
+        deps["tray_manager"].set_plugin_items.assert_called_once_with(mock_items)
 
-    def test_on_plugin_click(self, mock_dependencies):
+    def test_on_plugin_click(self, app_and_deps):
         """Test handling plugin click."""
+        application, deps = app_and_deps
+
         mock_plugin = MagicMock()
         mock_plugin.has_window.return_value = True
 
@@ -324,21 +420,21 @@ class TestApplicationPluginCoordination:
         mock_window.isVisible.return_value = False
         mock_plugin.create_window.return_value = mock_window
 
-        application = Application(**mock_dependencies)
         application._on_plugin_click(mock_plugin)
 
         # Should create and show window (non-modal)
-        mock_plugin.create_window.assert_called_once()
-        mock_window.show.assert_called_once()
-        mock_window.raise_.assert_called_once()
-        mock_window.activateWindow.assert_called_once()
+        assert mock_plugin.create_window.call_count == 1
+        assert mock_window.show.call_count == 1
+        assert mock_window.raise_.call_count == 1
+        assert mock_window.activateWindow.call_count == 1
 
-    def test_on_plugin_click_no_window(self, mock_dependencies):
+    def test_on_plugin_click_no_window(self, app_and_deps):
         """Test handling plugin click when plugin has no window."""
+        application, deps = app_and_deps
+
         mock_plugin = MagicMock()
         mock_plugin.has_window.return_value = False
 
-        application = Application(**mock_dependencies)
         application._on_plugin_click(mock_plugin)
 
         # Should not create window
@@ -348,36 +444,32 @@ class TestApplicationPluginCoordination:
 class TestApplicationServerReconnect:
     """Tests for server reconnection."""
 
-    @pytest.mark.asyncio
-    async def test_reconnect_server(self, mock_dependencies):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_reconnect_server(self, mock_dependencies, stub_server_client_cls):
         """Test reconnecting to server."""
-        mock_dependencies["config_manager"].get.side_effect = lambda key, default=None: {
+        mock_dependencies["config_manager"].get.side_effect = _config_side_effect({
             "server_url": "http://new-server.com",
             "device_key": "new-key",
             "reconnect_interval": 5000,
             "auto_connect": True
-        }.get(key, default)
+        })
 
         application = Application(**mock_dependencies)
 
-        with patch("core.server_client.ServerClient") as MockServerClient:
-            mock_new_client = MagicMock()
-            mock_new_client.link_device = AsyncMock(return_value=True)
-            mock_new_client.connect = AsyncMock()
-            mock_new_client.on_action = MagicMock()
-            MockServerClient.return_value = mock_new_client
+        await application._reconnect_server()
 
-            await application._reconnect_server()
+        # Should close old client
+        assert mock_dependencies["server_client"].close.call_count == 1
 
-            # Should close old client
-            mock_dependencies["server_client"].close.assert_called_once()
+        # Should create new client with the updated settings
+        assert len(stub_server_client_cls.instances) == 1
+        new_client = stub_server_client_cls.instances[0]
+        assert application.server_client is new_client
+        assert new_client.kwargs["server_url"] == "http://new-server.com"
 
-            # Should create new client
-            MockServerClient.assert_called_once()
-
-            # Should link device then connect if auto_connect
-            mock_new_client.link_device.assert_called_once()
-            mock_new_client.connect.assert_called_once()
+        # Should link device then connect if auto_connect
+        assert new_client.link_device.call_count == 1
+        assert new_client.connect.call_count == 1
 
 
 class TestApplicationConnectionStatus:
@@ -389,229 +481,131 @@ class TestApplicationConnectionStatus:
         application = Application(**mock_dependencies)
 
         # Check that handlers are registered
-        assert Topics.SERVER_CONNECTED in event_bus._sync_handlers
-        assert Topics.SERVER_DISCONNECTED in event_bus._sync_handlers
-        assert Topics.SERVER_ERROR in event_bus._sync_handlers
-        assert Topics.UI_CONNECT_REQUESTED in event_bus._sync_handlers
-        assert Topics.UI_DISCONNECT_REQUESTED in event_bus._sync_handlers
-
-    def test_handle_server_connected(self, mock_dependencies):
-        """Test handling server connected event."""
-        application = Application(**mock_dependencies)
-
-        # Publish event
-        application.event_bus.publish(Topics.SERVER_CONNECTED, None)
-
-        # Should update tray status
-        mock_dependencies["tray_manager"].set_connection_status.assert_called_with(
-            ConnectionStatus.CONNECTED
-        )
-
-    def test_handle_server_disconnected(self, mock_dependencies):
-        """Test handling server disconnected event."""
-        application = Application(**mock_dependencies)
-
-        # Publish event
-        application.event_bus.publish(Topics.SERVER_DISCONNECTED, None)
+        assert _EXPECTED_CONNECTION_TOPICS.issubset(event_bus._sync_handlers)
+
+    @pytest.mark.parametrize("topic,payload,expected_status,server_method", [
+        (Topics.SERVER_CONNECTED, None, ConnectionStatus.CONNECTED, None),
+        (Topics.SERVER_DISCONNECTED, None, ConnectionStatus.DISCONNECTED, None),
+        (Topics.SERVER_ERROR, {"reason": "max_retries"}, ConnectionStatus.ERROR, None),
+        (Topics.UI_CONNECT_REQUESTED, None, ConnectionStatus.CONNECTING, "connect"),
+        (Topics.UI_DISCONNECT_REQUESTED, None, None, "disconnect"),
+    ], ids=["server-connected", "server-disconnected", "server-error",
+            "connect-request", "disconnect-request"])
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_handle_connection_event(
+        self, app_and_deps, topic, payload, expected_status, server_method
+    ):
+        """Test connection events update the tray status and drive the server client."""
+        application, deps = app_and_deps
+
+        # Handle event and run any scheduled task
+        with _capture_tasks() as tasks:
+            _invoke(application, topic, payload)
+        for task in tasks:
+            await task
 
         # Should update tray status
-        mock_dependencies["tray_manager"].set_connection_status.assert_called_with(
-            ConnectionStatus.DISCONNECTED
-        )
+        if expected_status is not None:
+            deps["tray_manager"].set_connection_status.assert_called_with(expected_status)
 
-    def test_handle_server_error(self, mock_dependencies):
-        """Test handling server error event."""
-        application = Application(**mock_dependencies)
-
-        # Publish event
-        application.event_bus.publish(Topics.SERVER_ERROR, {"reason": "max_retries"})
+        # Should call the server client (connect/disconnect requests)
+        if server_method is not None:
+            assert getattr(deps["server_client"], server_method).call_count == 1
 
-        # Should update tray status
-        mock_dependencies["tray_manager"].set_connection_status.assert_called_with(
-            ConnectionStatus.ERROR
-        )
-
-    def test_handle_connect_request(self, mock_dependencies):
-        """Test handling connect request from UI."""
-        application = Application(**mock_dependencies)
-
-        # Publish event
-        application.event_bus.publish(Topics.UI_CONNECT_REQUESTED, None)
-
-        # Should update tray to connecting and call connect
-        mock_dependencies["tray_manager"].set_connection_status.assert_called_with(
-            ConnectionStatus.CONNECTING
-        )
-        mock_dependencies["server_client"].connect.assert_called_once()
-
-    def test_handle_disconnect_request(self, mock_dependencies):
-        """Test handling disconnect request from UI."""
-        application = Application(**mock_dependencies)
-
-        # Publish event
-        application.event_bus.publish(Topics.UI_DISCONNECT_REQUESTED, None)
-
-        # Should call disconnect
-        mock_dependencies["server_client"].disconnect.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_initialize_sets_disconnected_status(self, mock_dependencies):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_initialize_sets_disconnected_status(self, mock_dependencies, status_recorder):
         """Test initialize sets initial disconnected status."""
         application = Application(**mock_dependencies)
 
         await application.initialize()
 
         # Should set initial status (called during initialize)
-        calls = mock_dependencies["tray_manager"].set_connection_status.call_args_list
-        # First call should be DISCONNECTED
-        assert any(call.args[0] == ConnectionStatus.DISCONNECTED for call in calls)
+        assert ConnectionStatus.DISCONNECTED in status_recorder
 
-    @pytest.mark.asyncio
-    async def test_run_sets_connecting_status(self, mock_dependencies):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_run_sets_connecting_status(self, mock_dependencies, status_recorder):
         """Test run sets connecting status before connecting."""
-        mock_dependencies["config_manager"].get.side_effect = lambda key, default=None: {
+        mock_dependencies["config_manager"].get.side_effect = _config_side_effect({
             "auto_connect": True,
             "device_key": "test-api-key",
-        }.get(key, default)
+        })
 
         application = Application(**mock_dependencies)
 
-        # Patch initialize and asyncio.sleep to exit immediately
-        with patch.object(application, "initialize", new_callable=AsyncMock), \
-             patch("asyncio.sleep", side_effect=[None, Exception("Exit loop")]):
-            try:
-                await application.run()
-            except Exception as e:
-                if str(e) != "Exit loop":
-                    raise
+        # Skip initialize and let the run loop exit after one tick
+        with patch.object(application, "initialize", _noop), \
+             _one_tick(application):
+            await application.run()
 
-            # Should set connecting status
-            calls = mock_dependencies["tray_manager"].set_connection_status.call_args_list
-            assert any(call.args[0] == ConnectionStatus.CONNECTING for call in calls)
+        # Should set connecting status
+        assert ConnectionStatus.CONNECTING in status_recorder
 
 
 class TestConnectWithLinking:
     """Tests for _connect_with_linking flow."""
 
-    @pytest.mark.asyncio
-    async def test_connect_with_linking_full_flow(self, mock_dependencies):
-        """Test full flow: link device then connect to Centrifugo."""
-        mock_dependencies["config_manager"].get.side_effect = lambda key, default=None: {
-            "device_key": "test-api-key",
-        }.get(key, default)
-        mock_dependencies["server_client"].link_device = AsyncMock(return_value=True)
-
-        application = Application(**mock_dependencies)
-        await application._connect_with_linking()
-
-        # Should link device first with capabilities
-        mock_dependencies["server_client"].link_device.assert_called_once_with(
-            device_os=mock_dependencies["device_info"].get_platform(),
-            device_name=mock_dependencies["device_info"].get_hostname(),
-            capabilities=mock_dependencies["plugin_manager"].get_capabilities(),
-        )
-        # Should save device_linked status
-        mock_dependencies["config_manager"].set.assert_called_with("device_linked", True)
-        mock_dependencies["config_manager"].save.assert_called_once()
-        # Should connect to Centrifugo
-        mock_dependencies["server_client"].connect.assert_called_once()
-        # Should set CONNECTING status
-        mock_dependencies["tray_manager"].set_connection_status.assert_called_with(
-            ConnectionStatus.CONNECTING
-        )
-
-    @pytest.mark.asyncio
-    async def test_connect_with_linking_no_device_key(self, mock_dependencies):
-        """Test that connection is skipped when no device key is set."""
-        mock_dependencies["config_manager"].get.side_effect = lambda key, default=None: {
-            "device_key": "",
-        }.get(key, default)
-
-        application = Application(**mock_dependencies)
-        await application._connect_with_linking()
-
-        # Should NOT attempt to link or connect
-        mock_dependencies["server_client"].link_device.assert_not_called()
-        mock_dependencies["server_client"].connect.assert_not_called()
-        # Should set DISCONNECTED status
-        mock_dependencies["tray_manager"].set_connection_status.assert_called_with(
-            ConnectionStatus.DISCONNECTED
-        )
-
-    @pytest.mark.asyncio
-    async def test_connect_with_linking_no_device_key_default(self, mock_dependencies):
-        """Test that connection is skipped when device key is not configured at all."""
-        mock_dependencies["config_manager"].get.side_effect = lambda key, default=None: {
-        }.get(key, default)
-
-        application = Application(**mock_dependencies)
+    @pytest.mark.parametrize(
+        "config,link_result,has_plugin_manager,expect_link,expect_connect,expected_status", [
+            ({"device_key": "test-api-key"}, True, True, True, True, ConnectionStatus.CONNECTING),
+            ({"device_key": ""}, True, True, False, False, ConnectionStatus.DISCONNECTED),
+            ({}, True, True, False, False, ConnectionStatus.DISCONNECTED),
+            ({"device_key": "test-api-key"}, False, True, True, False, ConnectionStatus.ERROR),
+            ({"device_key": "test-api-key"}, True, False, True, True, ConnectionStatus.CONNECTING),
+        ],
+        ids=["full", "no_key", "default_no_key", "link_fails", "no_plugin_mgr"],
+    )
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_connect_with_linking(
+        self, mock_dependencies, config, link_result, has_plugin_manager,
+        expect_link, expect_connect, expected_status
+    ):
+        """Test linking then connecting, or skipping either step."""
+        deps = mock_dependencies
+        deps["config_manager"].get.side_effect = _config_side_effect(config)
+        deps["server_client"].link_device.return_value = link_result
+        if not has_plugin_manager:
+            deps["plugin_manager"] = None
+
+        application = Application(**deps)
         await application._connect_with_linking()
 
-        # Should NOT attempt to link or connect
-        mock_dependencies["server_client"].link_device.assert_not_called()
-        mock_dependencies["server_client"].connect.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_connect_with_linking_link_fails(self, mock_dependencies):
-        """Test that Centrifugo connection is skipped when linking fails."""
-        mock_dependencies["config_manager"].get.side_effect = lambda key, default=None: {
-            "device_key": "test-api-key",
-        }.get(key, default)
-        mock_dependencies["server_client"].link_device = AsyncMock(return_value=False)
-
-        application = Application(**mock_dependencies)
-        await application._connect_with_linking()
-
-        # Should attempt to link with capabilities
-        mock_dependencies["server_client"].link_device.assert_called_once_with(
-            device_os=mock_dependencies["device_info"].get_platform(),
-            device_name=mock_dependencies["device_info"].get_hostname(),
-            capabilities=mock_dependencies["plugin_manager"].get_capabilities(),
-        )
-        # Should NOT connect to Centrifugo
-        mock_dependencies["server_client"].connect.assert_not_called()
-        # Should set ERROR status
-        mock_dependencies["tray_manager"].set_connection_status.assert_called_with(
-            ConnectionStatus.ERROR
-        )
-
-    @pytest.mark.asyncio
-    async def test_connect_with_linking_without_plugin_manager(self, mock_dependencies):
-        """Test that capabilities is None when plugin_manager is None."""
-        mock_dependencies["config_manager"].get.side_effect = lambda key, default=None: {
-            "device_key": "test-api-key",
-        }.get(key, default)
-        mock_dependencies["plugin_manager"] = None
-        mock_dependencies["server_client"].link_device = AsyncMock(return_value=True)
-
-        application = Application(**mock_dependencies)
-        await application._connect_with_linking()
-
-        # Should link device with capabilities=None
-        mock_dependencies["server_client"].link_device.assert_called_once_with(
-            device_os=mock_dependencies["device_info"].get_platform(),
-            device_name=mock_dependencies["device_info"].get_hostname(),
-            capabilities=None,
-        )
-
-    @pytest.mark.asyncio
-    async def test_connect_with_linking_sets_connecting_before_link(self, mock_dependencies):
+        # Should link device with capabilities (None without plugin manager)
+        server_client = deps["server_client"]
+        if expect_link:
+            server_client.link_device.assert_called_once_with(
+                device_os=deps["device_info"].get_platform(),
+                device_name=deps["device_info"].get_hostname(),
+                capabilities=(
+                    deps["plugin_manager"].get_capabilities() if has_plugin_manager else None
+                ),
+            )
+        else:
+            server_client.link_device.assert_not_called()
+
+        # Should save device_linked status and connect only after linking succeeds
+        if expect_connect:
+            deps["config_manager"].set.assert_called_with("device_linked", True)
+            assert deps["config_manager"].save.call_count == 1
+            assert server_client.connect.call_count == 1
+        else:
+            server_client.connect.assert_not_called()
+
+        # Should end with the expected tray status
+        deps["tray_manager"].set_connection_status.assert_called_with(expected_status)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_connect_with_linking_sets_connecting_before_link(
+        self, mock_dependencies, status_recorder
+    ):
         """Test that CONNECTING status is set before attempting to link."""
-        mock_dependencies["config_manager"].get.side_effect = lambda key, default=None: {
+        mock_dependencies["config_manager"].get.side_effect = _config_side_effect({
             "device_key": "test-api-key",
-        }.get(key, default)
+        })
         mock_dependencies["server_client"].link_device = AsyncMock(return_value=True)
 
         application = Application(**mock_dependencies)
 
-        status_calls = []
-        original_set = mock_dependencies["tray_manager"].set_connection_status
-        def track_status(status):
-            status_calls.append(status)
-            return original_set(status)
-        mock_dependencies["tray_manager"].set_connection_status = track_status
-
         await application._connect_with_linking()
 
         # First status should be CONNECTING
-        assert status_calls[0] == ConnectionStatus.CONNECTING
+        assert status_recorder[0] == ConnectionStatus.CONNECTING
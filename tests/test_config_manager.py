@@ -1,8 +1,13 @@
 """Tests for core.config_manager module."""
 
+import gc
 import pytest
 import json
+import threading
+import weakref
+from collections.abc import Mapping
 from pathlib import Path
+from core import config_manager, json_utils
 from core.config_manager import ConfigManager
 
 
@@ -16,7 +21,16 @@ class TestConfigManagerInit:
 
         assert config.config_path == config_path
         assert config._config == {}
-        assert isinstance(config._defaults, dict)
+        assert isinstance(config._defaults, Mapping)
+
+    def test_defaults_shared_and_read_only(self, tmp_path):
+        """Test defaults are one shared read-only mapping."""
+        config1 = ConfigManager(tmp_path / "a.json")
+        config2 = ConfigManager(tmp_path / "b.json")
+
+        assert config1._defaults is config2._defaults
+        with pytest.raises(TypeError):
+            config1._defaults["server_url"] = "http://changed"
 
     def test_defaults_defined(self, tmp_path):
         """Test default configuration values are defined."""
@@ -49,12 +63,12 @@ class TestConfigManagerInit:
 class TestConfigLoad:
     """Test cases for load() method."""
 
-    def test_load_nonexistent_file_creates_defaults(self, tmp_path):
-        """Test loading nonexistent file creates default config."""
+    def test_ensure_nonexistent_file_creates_defaults(self, tmp_path):
+        """Test ensure() on a nonexistent file creates default config."""
         config_path = tmp_path / "config.json"
         config = ConfigManager(config_path)
 
-        result = config.load()
+        result = config.ensure()
 
         # Should have defaults plus auto-generated device_id
         assert result["server_url"] == config._defaults["server_url"]
@@ -69,6 +83,37 @@ class TestConfigLoad:
         # Should create the file
         assert config_path.exists()
 
+    def test_load_nonexistent_file_does_not_write(self, tmp_path):
+        """Test load() returns defaults without creating the file."""
+        config_path = tmp_path / "config.json"
+        config = ConfigManager(config_path)
+
+        result = config.load()
+
+        assert result["server_url"] == config._defaults["server_url"]
+        assert len(result["device_id"]) == 36
+        assert not config_path.exists()
+
+    def test_ensure_adds_missing_device_id(self, tmp_path):
+        """Test ensure() persists a generated device_id."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text('{"custom": 1}')
+        config = ConfigManager(config_path)
+
+        result = config.ensure()
+
+        saved = json.loads(config_path.read_text())
+        assert saved == {"custom": 1, "device_id": result["device_id"]}
+
+    def test_ensure_existing_complete_file_is_not_rewritten(self, tmp_path):
+        """Test ensure() leaves a complete config file untouched."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text('{"device_id": "abc"}')
+        config = ConfigManager(config_path)
+
+        assert config.ensure() == {"device_id": "abc"}
+        assert config_path.read_text() == '{"device_id": "abc"}'
+
     def test_load_existing_file(self, tmp_path):
         """Test loading existing config file."""
         config_path = tmp_path / "config.json"
@@ -162,6 +207,28 @@ class TestConfigSave:
         assert saved_data == {"new": "data"}
         assert "old" not in saved_data
 
+    def test_save_sorts_keys(self, tmp_path):
+        """Test save() writes keys in sorted order."""
+        config_path = tmp_path / "config.json"
+        config = ConfigManager(config_path)
+
+        config._config = {"b": 1, "a": {"d": 2, "c": 3}}
+        config.save()
+
+        assert config_path.read_text() == json.dumps(
+            {"a": {"c": 3, "d": 2}, "b": 1}, indent=2
+        )
+
+    def test_save_leaves_no_temp_file(self, tmp_path):
+        """Test save() replaces the config atomically without leftovers."""
+        config_path = tmp_path / "config.json"
+        config = ConfigManager(config_path)
+
+        config._config = {"test": "value"}
+        config.save()
+
+        assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
     def test_save_preserves_unicode(self, tmp_path):
         """Test save() preserves unicode characters."""
         config_path = tmp_path / "config.json"
@@ -436,3 +503,98 @@ class TestConfigIntegration:
         # config1 reloads and sees new data
         config1.load()
         assert config1.get("key") == "value2"
+
+
+class TestConfigDelayedSave:
+    """Test cases for write-behind saving with save_delay."""
+
+    def test_no_delay_does_not_autosave(self, tmp_path):
+        """Test set() doesn't write or schedule anything by default."""
+        config_path = tmp_path / "config.json"
+        config = ConfigManager(config_path)
+
+        config.set("key", "value")
+
+        assert config._save_timer is None
+        assert not config_path.exists()
+
+    def test_changes_coalesce_until_flush(self, tmp_path):
+        """Test a burst of changes is written once by flush()."""
+        config_path = tmp_path / "config.json"
+        config = ConfigManager(config_path, save_delay=60)
+
+        config.set("a", 1)
+        timer = config._save_timer
+        config.update({"b": 2})
+        config.device_id = "device-1"
+
+        assert config._save_timer is timer
+        assert not config_path.exists()
+
+        config.flush()
+
+        assert json.loads(config_path.read_text()) == {"a": 1, "b": 2, "device_id": "device-1"}
+        assert config._save_timer is None
+        assert timer.finished.is_set()
+
+    def test_delayed_save_writes_file(self, tmp_path):
+        """Test the scheduled save writes the config after the delay."""
+        config_path = tmp_path / "config.json"
+        config = ConfigManager(config_path, save_delay=0.01)
+
+        config.set("key", "value")
+        # The timer clears _save_timer when it fires, so hold our own reference
+        timer = config._save_timer
+        timer.join(timeout=5)
+
+        assert json.loads(config_path.read_text()) == {"key": "value"}
+
+    def test_pending_changes_flushed_at_exit(self, tmp_path):
+        """Test the exit hook writes changes still waiting on the timer."""
+        config_path = tmp_path / "config.json"
+        config = ConfigManager(config_path, save_delay=60)
+
+        config.set("key", "value")
+        config_manager._flush_delayed_saves()
+
+        assert json.loads(config_path.read_text()) == {"key": "value"}
+
+    def test_delayed_save_manager_can_be_collected(self, tmp_path):
+        """Test the exit hook doesn't keep ConfigManager instances alive."""
+        config = ConfigManager(tmp_path / "config.json", save_delay=60)
+        ref = weakref.ref(config)
+
+        del config
+        gc.collect()
+
+        assert ref() is None
+
+    def test_save_encodes_a_snapshot(self, tmp_path, monkeypatch):
+        """Test set() from another thread during a save doesn't touch the dict being encoded."""
+        config = ConfigManager(tmp_path / "config.json")
+        config.set("key", "value")
+        original_dumps = json_utils.dumps_pretty
+        encoded = []
+
+        def dumps_with_concurrent_set(obj, sort_keys=False):
+            writer = threading.Thread(target=config.set, args=("late", 1))
+            writer.start()
+            writer.join(timeout=5)
+            encoded.append(obj)
+            return original_dumps(obj, sort_keys=sort_keys)
+
+        monkeypatch.setattr(json_utils, "dumps_pretty", dumps_with_concurrent_set)
+        config.save()
+
+        assert encoded[0] is not config._config
+        assert json.loads((tmp_path / "config.json").read_text()) == {"key": "value"}
+        assert config.get("late") == 1
+
+    def test_flush_without_changes_is_noop(self, tmp_path):
+        """Test flush() doesn't write when nothing changed."""
+        config_path = tmp_path / "config.json"
+        config = ConfigManager(config_path, save_delay=60)
+
+        config.flush()
+
+        assert not config_path.exists()
@@ -4,7 +4,15 @@ import pytest
 import socket
 import platform
 from unittest.mock import MagicMock
-from core.device_info import DeviceInfo
+from core.device_info import DeviceInfo, _reset_cache, refresh_hostname
+
+
+@pytest.fixture(autouse=True)
+def _clear_device_info_cache():
+    """Re-run the platform probes for every test so monkeypatches apply."""
+    _reset_cache()
+    yield
+    _reset_cache()
 
 
 @pytest.fixture
@@ -124,6 +132,19 @@ class TestGetHostname:
         result = DeviceInfo.get_hostname()
         assert result == "test-hostname"
 
+    def test_refresh_hostname(self, monkeypatch):
+        """Test refresh_hostname() picks up a changed hostname."""
+        monkeypatch.setattr(socket, "gethostname", lambda: "old-host")
+        assert DeviceInfo.get_hostname() == "old-host"
+        assert DeviceInfo.get_system_info()["hostname"] == "old-host"
+
+        monkeypatch.setattr(socket, "gethostname", lambda: "new-host")
+        assert DeviceInfo.get_hostname() == "old-host"
+
+        assert refresh_hostname() == "new-host"
+        assert DeviceInfo.get_hostname() == "new-host"
+        assert DeviceInfo.get_system_info()["hostname"] == "new-host"
+
     def test_get_hostname_real(self):
         """Test get_hostname() returns actual hostname."""
         # Should not raise and should return a string
@@ -190,3 +211,16 @@ class TestGetSystemInfo:
 
         for key, value in info.items():
             assert isinstance(value, str), f"{key} is not a string: {type(value)}"
+
+    def test_get_system_info_cached(self, monkeypatch):
+        """Test get_system_info() probes once and returns independent copies."""
+        calls = []
+        monkeypatch.setattr(platform, "release", lambda: calls.append(1) or "5.10.0")
+
+        first = DeviceInfo.get_system_info()
+        first["release"] = "mutated"
+        second = DeviceInfo.get_system_info()
+
+        assert len(calls) == 1
+        assert second["release"] == "5.10.0"
+        assert first is not second
@@ -7,6 +7,18 @@ from unittest.mock import MagicMock
 from core.di_container import DIContainer, ContainerBuilder
 
 
+@pytest.fixture(scope="module")
+def built_container():
+    """Build one container for the tests that only inspect it.
+
+    Tests that resolve factories build their own container, so this one
+    stays in its just-built state.
+    """
+    app = MagicMock()
+    loop = MagicMock()
+    return ContainerBuilder.build_container(app, loop), app, loop
+
+
 class TestDIContainer:
     """Tests for DIContainer class."""
 
@@ -81,6 +93,23 @@ class TestDIContainer:
         assert result == "singleton_value"
         assert len(factory_called) == 0  # Factory not called
 
+    def test_factory_error_is_not_cached(self):
+        """Test that a failing factory is retried on the next get()."""
+        container = DIContainer()
+        results = [RuntimeError("not ready"), "value"]
+
+        def factory():
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        container.register_factory("test", factory)
+
+        with pytest.raises(RuntimeError):
+            container.get("test")
+        assert container.get("test") == "value"
+
     def test_factory_creates_singleton(self):
         """Test that factory result is cached as singleton."""
         container = DIContainer()
@@ -102,17 +131,107 @@ class TestDIContainer:
         assert len(call_count) == 1
 
 
+    def test_resolver(self):
+        """Test that a resolver creates and caches like get()."""
+        container = DIContainer()
+        calls = []
+        container.register_factory("test", lambda: calls.append(True) or object())
+
+        resolve = container.resolver("test")
+
+        assert calls == []
+        assert resolve() is resolve()
+        assert resolve() is container.get("test")
+        assert len(calls) == 1
+
+    def test_resolver_sees_later_singleton(self):
+        """Test that a resolver follows a singleton registered afterwards."""
+        container = DIContainer()
+        container.register_factory("test", lambda: "factory_value")
+        resolve = container.resolver("test")
+
+        container.register_singleton("test", "singleton_value")
+
+        assert resolve() == "singleton_value"
+
+    def test_resolver_unknown_name(self):
+        """Test that resolver() fails fast for unknown components."""
+        container = DIContainer()
+
+        with pytest.raises(KeyError, match="Component 'missing' not found"):
+            container.resolver("missing")
+
+    def test_freeze_blocks_registration(self):
+        """Test that a frozen container rejects new registrations."""
+        container = DIContainer()
+        container.register_factory("test", lambda: "value")
+        container.freeze()
+
+        with pytest.raises(RuntimeError, match="frozen"):
+            container.register_singleton("other", "value")
+        with pytest.raises(RuntimeError, match="frozen"):
+            container.register_factory("test", lambda: "replaced")
+
+        # Resolution still works
+        assert container.get("test") == "value"
+
+        with pytest.raises(TypeError):
+            container._registrations["other"] = None
+
+
+    def test_eager_init_follows_dependencies(self):
+        """Test that eager_init() creates components after their dependencies."""
+        container = DIContainer()
+        created = []
+
+        def factory(name):
+            return lambda: created.append(name) or name
+
+        container.register_factory("client", factory("client"), depends_on=("config", "device"))
+        container.register_factory("device", factory("device"), depends_on=("config",))
+        container.register_factory("config", factory("config"))
+        container.register_singleton("bus", "bus")
+        container.freeze()
+
+        components = container.eager_init()
+
+        assert created == ["config", "device", "client"]
+        assert components == {"config": "config", "device": "device", "client": "client", "bus": "bus"}
+        assert container.get("client") == "client"
+        assert created == ["config", "device", "client"]
+
+    def test_eager_init_requires_freeze(self):
+        """Test that eager_init() is only available on a frozen container."""
+        container = DIContainer()
+
+        with pytest.raises(RuntimeError, match="frozen"):
+            container.eager_init()
+
+    def test_freeze_rejects_dependency_cycle(self):
+        """Test that freeze() reports cyclic factory dependencies."""
+        container = DIContainer()
+        container.register_factory("a", lambda: "a", depends_on=("b",))
+        container.register_factory("b", lambda: "b", depends_on=("a",))
+        container.register_factory("c", lambda: "c")
+
+        with pytest.raises(ValueError, match="cycle between components: a, b"):
+            container.freeze()
+
+    def test_freeze_rejects_unknown_dependency(self):
+        """Test that freeze() reports dependencies that aren't registered."""
+        container = DIContainer()
+        container.register_factory("a", lambda: "a", depends_on=("missing",))
+
+        with pytest.raises(KeyError, match="unknown component 'missing'"):
+            container.freeze()
+
+
 class TestContainerBuilder:
     """Tests for ContainerBuilder."""
 
-    def test_build_container(self, tmp_path):
+    def test_build_container(self, built_container):
         """Test building a container."""
-        # Mock Qt app and loop
-        app = MagicMock()
-        loop = MagicMock()
-
-        # Build container
-        container = ContainerBuilder.build_container(app, loop)
+        container, _, _ = built_container
 
         # Check registered components
         assert container.has("app")
@@ -124,12 +243,13 @@ class TestContainerBuilder:
         assert container.has("server_client")
         assert container.has("tray_manager")
 
-    def test_build_container_paths(self):
-        """Test that paths are registered."""
-        app = MagicMock()
-        loop = MagicMock()
+        # Registration is complete once the builder returns
+        with pytest.raises(RuntimeError):
+            container.register_singleton("late", object())
 
-        container = ContainerBuilder.build_container(app, loop)
+    def test_build_container_paths(self, built_container):
+        """Test that paths are registered."""
+        container, _, _ = built_container
 
         # Check path components
         assert container.has("app_dir")
@@ -143,44 +263,36 @@ class TestContainerBuilder:
         assert isinstance(container.get("plugins_dir"), Path)
         assert isinstance(container.get("assets_dir"), Path)
 
-    def test_build_container_qt_components(self):
+    def test_build_container_qt_components(self, built_container):
         """Test that Qt components are registered."""
-        app = MagicMock()
-        loop = MagicMock()
-
-        container = ContainerBuilder.build_container(app, loop)
+        container, app, loop = built_container
 
         assert container.get("app") is app
         assert container.get("loop") is loop
 
-    def test_build_container_event_bus(self):
+    def test_build_container_event_bus(self, built_container):
         """Test that EventBus is created."""
-        app = MagicMock()
-        loop = MagicMock()
-
-        container = ContainerBuilder.build_container(app, loop)
+        container, _, _ = built_container
 
         event_bus = container.get("event_bus")
         assert event_bus is not None
         assert hasattr(event_bus, "subscribe")
         assert hasattr(event_bus, "publish")
 
-    def test_build_container_lazy_initialization(self):
+    def test_build_container_lazy_initialization(self, built_container):
         """Test that components are created lazily."""
-        app = MagicMock()
-        loop = MagicMock()
+        container, _, _ = built_container
 
-        container = ContainerBuilder.build_container(app, loop)
+        registrations = container._registrations
 
         # Event bus should be created immediately (singleton)
-        assert "event_bus" in container._singletons
+        assert registrations["event_bus"].resolved
 
         # Other components should be factories (not yet created)
-        assert "config_manager" in container._factories
-        assert "device_info" in container._factories
-        assert "plugin_manager" in container._factories
-        assert "server_client" in container._factories
-        assert "tray_manager" in container._factories
+        for name in ("config_manager", "device_info", "plugin_manager",
+                     "server_client", "tray_manager"):
+            assert registrations[name].factory is not None
+            assert not registrations[name].resolved
 
     def test_build_container_component_creation(self):
         """Test that components can be created."""
@@ -2,56 +2,67 @@
 
 import pytest
 import asyncio
+import sys
 from unittest.mock import MagicMock, AsyncMock
 
 from core.event_bus import EventBus, Topics, Event
 
 
+def _sync(bus, topic):
+    """Return the sync handlers subscribed to topic (empty if none)."""
+    rec = bus._handlers.get(topic)
+    return rec.sync if rec is not None else ()
+
+
+def _async(bus, topic):
+    """Return the async handlers subscribed to topic (empty if none)."""
+    rec = bus._handlers.get(topic)
+    return rec.async_ if rec is not None else ()
+
+
+@pytest.fixture
+def bus():
+    """Provide an EventBus, cleared after the test."""
+    event_bus = EventBus()
+    yield event_bus
+    event_bus.clear()
+
+
 class TestEventBusInit:
     """Tests for EventBus initialization."""
 
     def test_init(self):
         bus = EventBus()
-        assert bus._sync_handlers == {}
-        assert bus._async_handlers == {}
+        assert bus._handlers == {}
 
 
 class TestSyncSubscribe:
     """Tests for synchronous subscription."""
 
-    def test_subscribe_handler(self):
-        bus = EventBus()
-        handler = MagicMock()
-
-        bus.subscribe("test.topic", handler)
-
-        assert "test.topic" in bus._sync_handlers
-        assert handler in bus._sync_handlers["test.topic"]
-
-    def test_subscribe_multiple_handlers(self):
-        bus = EventBus()
-        handler1 = MagicMock()
-        handler2 = MagicMock()
+    @pytest.mark.parametrize("subscriptions", [
+        [("test.topic", 0)],
+        [("test.topic", 0), ("test.topic", 1)],
+        [("topic1", 0), ("topic2", 1)],
+    ], ids=["single", "multiple_handlers", "different_topics"])
+    def test_subscribe(self, bus, subscriptions):
+        handlers = [MagicMock(), MagicMock()]
 
-        bus.subscribe("test.topic", handler1)
-        bus.subscribe("test.topic", handler2)
+        for topic, index in subscriptions:
+            bus.subscribe(topic, handlers[index])
 
-        assert len(bus._sync_handlers["test.topic"]) == 2
-        assert handler1 in bus._sync_handlers["test.topic"]
-        assert handler2 in bus._sync_handlers["test.topic"]
+        for topic in {topic for topic, _ in subscriptions}:
+            expected = [handlers[i] for t, i in subscriptions if t == topic]
+            assert list(_sync(bus, topic)) == expected
 
-    def test_subscribe_different_topics(self):
-        bus = EventBus()
-        handler1 = MagicMock()
-        handler2 = MagicMock()
+    def test_subscribe_same_handler_twice(self, bus):
+        handler = MagicMock()
 
-        bus.subscribe("topic1", handler1)
-        bus.subscribe("topic2", handler2)
+        bus.subscribe("test.topic", handler)
+        bus.subscribe("test.topic", handler)
+        bus.publish("test.topic", "data")
 
-        assert "topic1" in bus._sync_handlers
-        assert "topic2" in bus._sync_handlers
-        assert handler1 in bus._sync_handlers["topic1"]
-        assert handler2 in bus._sync_handlers["topic2"]
+        assert len(_sync(bus, "test.topic")) == 1
+        handler.assert_called_once_with("data")
 
 
 class TestAsyncSubscribe:
@@ -63,8 +74,8 @@ class TestAsyncSubscribe:
 
         bus.subscribe_async("test.topic", handler)
 
-        assert "test.topic" in bus._async_handlers
-        assert handler in bus._async_handlers["test.topic"]
+        assert "test.topic" in bus._handlers
+        assert handler in _async(bus, "test.topic")
 
     def test_subscribe_multiple_async_handlers(self):
         bus = EventBus()
@@ -74,9 +85,21 @@ class TestAsyncSubscribe:
         bus.subscribe_async("test.topic", handler1)
         bus.subscribe_async("test.topic", handler2)
 
-        assert len(bus._async_handlers["test.topic"]) == 2
-        assert handler1 in bus._async_handlers["test.topic"]
-        assert handler2 in bus._async_handlers["test.topic"]
+        assert len(_async(bus, "test.topic")) == 2
+        assert handler1 in _async(bus, "test.topic")
+        assert handler2 in _async(bus, "test.topic")
+
+    def test_sync_and_async_share_topic_record(self):
+        bus = EventBus()
+        sync_handler = MagicMock()
+        async_handler = AsyncMock()
+
+        bus.subscribe("test.topic", sync_handler)
+        bus.subscribe_async("test.topic", async_handler)
+
+        assert list(bus._handlers) == ["test.topic"]
+        assert list(_sync(bus, "test.topic")) == [sync_handler]
+        assert list(_async(bus, "test.topic")) == [async_handler]
 
 
 class TestUnsubscribe:
@@ -89,7 +112,7 @@ class TestUnsubscribe:
         bus.subscribe("test.topic", handler)
         bus.unsubscribe("test.topic", handler)
 
-        assert handler not in bus._sync_handlers.get("test.topic", [])
+        assert handler not in _sync(bus, "test.topic")
 
     def test_unsubscribe_async_handler(self):
         bus = EventBus()
@@ -98,7 +121,21 @@ class TestUnsubscribe:
         bus.subscribe_async("test.topic", handler)
         bus.unsubscribe("test.topic", handler)
 
-        assert handler not in bus._async_handlers.get("test.topic", [])
+        assert handler not in _async(bus, "test.topic")
+
+    def test_unsubscribe_last_handler_drops_topic(self):
+        bus = EventBus()
+        sync_handler = MagicMock()
+        async_handler = AsyncMock()
+        bus.subscribe("test.topic", sync_handler)
+        bus.subscribe_async("test.topic", async_handler)
+
+        bus.unsubscribe("test.topic", sync_handler)
+        assert "test.topic" in bus._handlers
+
+        bus.unsubscribe("test.topic", async_handler)
+        assert "test.topic" not in bus._handlers
+        assert bus.get_all_topics() == []
 
     def test_unsubscribe_nonexistent_handler(self):
         bus = EventBus()
@@ -158,10 +195,48 @@ class TestPublish:
         handler.assert_called_once()
 
 
+    def test_publish_tolerates_unsubscribe_during_dispatch(self):
+        bus = EventBus()
+        later = MagicMock()
+
+        def first(data):
+            bus.unsubscribe("test.topic", first)
+            bus.unsubscribe("test.topic", later)
+
+        bus.subscribe("test.topic", first)
+        bus.subscribe("test.topic", later)
+
+        bus.publish("test.topic", "data")
+
+        later.assert_called_once_with("data")
+        assert bus.get_subscriber_count("test.topic") == 0
+
+    def test_publish_defers_subscribe_during_dispatch(self):
+        bus = EventBus()
+        received = []
+
+        def first(data):
+            received.append(("first", data))
+            bus.subscribe("test.topic", received.append)
+            if data == "outer":
+                bus.publish("test.topic", "nested")
+
+        bus.subscribe("test.topic", first)
+
+        bus.publish("test.topic", "outer")
+        # The nested publish already sees the new handler; the outer
+        # dispatch doesn't
+        assert received == [("first", "outer"), ("first", "nested"), "nested"]
+
+        received.clear()
+        bus.publish("test.topic", "next")
+        assert received == [("first", "next"), "next"]
+
+
 class TestPublishAsync:
     """Tests for asynchronous publishing."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_publish_async_calls_handler(self):
         bus = EventBus()
         handler = AsyncMock()
@@ -171,7 +246,7 @@ class TestPublishAsync:
 
         handler.assert_called_once_with({"key": "value"})
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_publish_async_calls_multiple_handlers(self):
         bus = EventBus()
         handler1 = AsyncMock()
@@ -184,14 +259,14 @@ class TestPublishAsync:
         handler1.assert_called_once_with("data")
         handler2.assert_called_once_with("data")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_publish_async_no_subscribers(self):
         bus = EventBus()
 
         # Should not raise error
         await bus.publish_async("test.topic", "data")
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_publish_async_handler_exception(self):
         bus = EventBus()
         handler = AsyncMock(side_effect=ValueError("test error"))
@@ -202,7 +277,31 @@ class TestPublishAsync:
 
         handler.assert_called_once()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_publish_async_exception_does_not_cancel_siblings(self, caplog):
+        bus = EventBus()
+        finished = []
+
+        async def failing(data):
+            raise ValueError("boom")
+
+        async def slow(data):
+            await asyncio.sleep(0.01)
+            finished.append(data)
+
+        def not_async(data):
+            return None
+
+        bus.subscribe_async("test.topic", failing)
+        bus.subscribe_async("test.topic", not_async)
+        bus.subscribe_async("test.topic", slow)
+
+        await bus.publish_async("test.topic", "data")
+
+        assert finished == ["data"]
+        assert "boom" in caplog.text
+
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_publish_async_concurrent_execution(self):
         """Test that async handlers run concurrently."""
         bus = EventBus()
@@ -238,8 +337,8 @@ class TestClear:
 
         bus.clear("topic1")
 
-        assert "topic1" not in bus._sync_handlers
-        assert "topic2" in bus._sync_handlers
+        assert "topic1" not in bus._handlers
+        assert "topic2" in bus._handlers
 
     def test_clear_all_topics(self):
         bus = EventBus()
@@ -250,8 +349,7 @@ class TestClear:
 
         bus.clear()
 
-        assert bus._sync_handlers == {}
-        assert bus._async_handlers == {}
+        assert bus._handlers == {}
 
     def test_clear_nonexistent_topic(self):
         bus = EventBus()
@@ -288,6 +386,20 @@ class TestUtilityMethods:
 
         assert bus.get_subscriber_count("test.topic") == 2
 
+    def test_get_subscriber_count_after_changes(self):
+        bus = EventBus()
+        sync_handler = MagicMock()
+        async_handler = AsyncMock()
+
+        bus.subscribe("test.topic", sync_handler)
+        bus.subscribe("test.topic", sync_handler)
+        bus.subscribe_async("test.topic", async_handler)
+        assert bus.get_subscriber_count("test.topic") == 2
+
+        bus.unsubscribe("test.topic", sync_handler)
+        bus.unsubscribe("test.topic", sync_handler)
+        assert bus.get_subscriber_count("test.topic") == 1
+
     def test_get_all_topics_empty(self):
         bus = EventBus()
         assert bus.get_all_topics() == []
@@ -299,7 +411,25 @@ class TestUtilityMethods:
         bus.subscribe("topic3", MagicMock())
 
         topics = bus.get_all_topics()
-        assert sorted(topics) == ["topic1", "topic2", "topic3"]
+        assert set(topics) == {"topic1", "topic2", "topic3"}
+
+    def test_get_all_topics_tracks_changes(self):
+        bus = EventBus()
+        handler = MagicMock()
+        bus.subscribe("b", handler)
+        assert bus.get_all_topics() == ["b"]
+
+        bus.subscribe("a", handler)
+        assert bus.get_all_topics() == ["a", "b"]
+
+        bus.unsubscribe("b", handler)
+        assert bus.get_all_topics() == ["a"]
+
+        bus.get_all_topics().append("mutated")
+        assert bus.get_all_topics() == ["a"]
+
+        bus.clear("a")
+        assert bus.get_all_topics() == []
 
 
 class TestTopicsConstants:
@@ -316,6 +446,11 @@ class TestTopicsConstants:
         assert isinstance(Topics.SERVER_ACTION, str)
         assert isinstance(Topics.UI_QUIT_REQUESTED, str)
 
+    def test_topics_are_interned(self):
+        for name, value in vars(Topics).items():
+            if name.isupper():
+                assert value is sys.intern(value), name
+
 
 class TestEvent:
     """Tests for Event dataclass."""
@@ -336,7 +471,7 @@ class TestEvent:
 class TestIntegration:
     """Integration tests for EventBus."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_mixed_sync_async_handlers(self):
         """Test that sync and async handlers can coexist."""
         bus = EventBus()
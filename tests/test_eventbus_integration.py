@@ -20,7 +20,7 @@ class TestPluginManagerEventBusIntegration:
         pm = PluginManager(tmp_path)
         handler_called = []
 
-        pm.on_event(lambda event: handler_called.append(event))
+        pm.on_event(handler_called.append)
 
         event = PluginEvent(plugin_id="test", event_name="test.event", data={})
         pm._handle_plugin_event(event)
@@ -34,7 +34,7 @@ class TestPluginManagerEventBusIntegration:
         pm = PluginManager(tmp_path, event_bus=event_bus)
 
         events_received = []
-        event_bus.subscribe(Topics.PLUGIN_EVENT, lambda e: events_received.append(e))
+        event_bus.subscribe(Topics.PLUGIN_EVENT, events_received.append)
 
         event = PluginEvent(plugin_id="test", event_name="test.event", data={})
         pm._handle_plugin_event(event)
@@ -49,11 +49,11 @@ class TestPluginManagerEventBusIntegration:
 
         # Register old-style callback
         callback_called = []
-        pm.on_event(lambda e: callback_called.append(e))
+        pm.on_event(callback_called.append)
 
         # Subscribe to EventBus
         bus_events = []
-        event_bus.subscribe(Topics.PLUGIN_EVENT, lambda e: bus_events.append(e))
+        event_bus.subscribe(Topics.PLUGIN_EVENT, bus_events.append)
 
         # Trigger event
         event = PluginEvent(plugin_id="test", event_name="test.event", data={})
@@ -76,7 +76,7 @@ class TestServerClientEventBusIntegration:
         )
 
         actions_received = []
-        client.on_action(lambda a: actions_received.append(a))
+        client.on_action(actions_received.append)
 
         action = ActionTask(type="TEST", parameters={})
         client._dispatch_action(action)
@@ -95,7 +95,7 @@ class TestServerClientEventBusIntegration:
         )
 
         actions_received = []
-        event_bus.subscribe(Topics.SERVER_ACTION, lambda a: actions_received.append(a))
+        event_bus.subscribe(Topics.SERVER_ACTION, actions_received.append)
 
         action = ActionTask(type="TEST", parameters={})
         client._dispatch_action(action)
@@ -115,11 +115,11 @@ class TestServerClientEventBusIntegration:
 
         # Register old-style callback
         callback_called = []
-        client.on_action(lambda a: callback_called.append(a))
+        client.on_action(callback_called.append)
 
         # Subscribe to EventBus
         bus_actions = []
-        event_bus.subscribe(Topics.SERVER_ACTION, lambda a: bus_actions.append(a))
+        event_bus.subscribe(Topics.SERVER_ACTION, bus_actions.append)
 
         # Dispatch action
         action = ActionTask(type="TEST", parameters={})
@@ -144,7 +144,7 @@ class TestEndToEndEventBusFlow:
 
         # Simulate application subscribing to plugin events
         received_events = []
-        event_bus.subscribe(Topics.PLUGIN_EVENT, lambda e: received_events.append(e))
+        event_bus.subscribe(Topics.PLUGIN_EVENT, received_events.append)
 
         # Simulate plugin emitting event
         event = PluginEvent(plugin_id="test-plugin", event_name="device.test", data={"value": 42})
@@ -167,7 +167,7 @@ class TestEndToEndEventBusFlow:
 
         # Simulate application subscribing to server actions
         received_actions = []
-        event_bus.subscribe(Topics.SERVER_ACTION, lambda a: received_actions.append(a))
+        event_bus.subscribe(Topics.SERVER_ACTION, received_actions.append)
 
         # Simulate server sending action
         action = ActionTask(type="desktop.action.notification.show", parameters={"message": "Test"})
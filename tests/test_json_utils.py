@@ -0,0 +1,78 @@
+"""Tests for core.json_utils module."""
+
+import json
+
+import pytest
+
+from core import json_utils
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run each test against orjson (if installed) and the stdlib fallback."""
+    if request.param == "orjson":
+        if json_utils.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(json_utils, "orjson", None)
+    return request.param
+
+
+class TestLoads:
+    """Test cases for loads()."""
+
+    def test_loads_bytes(self, backend):
+        """Test loads() parses UTF-8 bytes."""
+        assert json_utils.loads(b'{"a": [1, 2], "b": null}') == {"a": [1, 2], "b": None}
+
+    def test_loads_unicode(self, backend):
+        """Test loads() decodes non-ASCII text."""
+        data = json.dumps({"name": "Тест", "emoji": "🚀"}, ensure_ascii=False).encode("utf-8")
+        assert json_utils.loads(data) == {"name": "Тест", "emoji": "🚀"}
+
+    def test_loads_invalid_raises_json_decode_error(self, backend):
+        """Test loads() raises JSONDecodeError on malformed input."""
+        with pytest.raises(json_utils.JSONDecodeError):
+            json_utils.loads(b"{invalid json")
+
+
+class TestDumps:
+    """Test cases for dumps()."""
+
+    def test_compact_output(self, backend):
+        """Test dumps() matches stdlib compact output."""
+        obj = {"a": [1, 2], "b": {"c": None}, "d": "Привет"}
+        expected = json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        assert json_utils.dumps(obj) == expected
+
+    def test_non_str_keys(self, backend):
+        """Test dumps() accepts non-str keys like the stdlib does."""
+        obj = {"data": {1: "one", 2.5: "x", None: "n"}, "flags": {True: "t"}}
+        expected = json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        assert json_utils.dumps(obj) == expected
+
+
+class TestDumpsPretty:
+    """Test cases for dumps_pretty()."""
+
+    def test_matches_stdlib_format(self, backend):
+        """Test dumps_pretty() matches stdlib indent=2 output."""
+        obj = {"a": 1, "b": {"nested": [1, 2]}, "c": "Привет", "d": None}
+        expected = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+        assert json_utils.dumps_pretty(obj) == expected
+
+    def test_sort_keys_matches_stdlib(self, backend):
+        """Test dumps_pretty(sort_keys=True) matches stdlib sorted output."""
+        obj = {"b": 1, "a": {"z": None, "y": [True]}}
+        expected = json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=True).encode("utf-8")
+
+        assert json_utils.dumps_pretty(obj, sort_keys=True) == expected
+
+    def test_round_trip(self, backend):
+        """Test dumps_pretty() output loads back to the same object."""
+        obj = {"enabled": True, "buttons": [{"params": {}}], "emoji": "🎉"}
+
+        assert json_utils.loads(json_utils.dumps_pretty(obj)) == obj
@@ -1,7 +1,11 @@
 """Tests for core.models module."""
 
+import json
+import os
+import uuid
+
 import pytest
-from datetime import datetime
+from datetime import datetime, timezone
 from core.models import TriggerPayload, ActionTask
 
 
@@ -45,6 +49,53 @@ class TestTriggerPayload:
         assert payload.occurred_at.endswith("Z")
         assert "T" in payload.occurred_at
 
+    def test_occurred_at_is_current_utc(self):
+        """Test occurred_at is a microsecond-precision UTC timestamp of creation time."""
+        before = datetime.now(timezone.utc)
+        payload = TriggerPayload(name="device.test", data={}, device_id="d")
+        after = datetime.now(timezone.utc)
+
+        occurred = datetime.fromisoformat(payload.occurred_at)
+        assert occurred.tzinfo is not None
+        assert before.replace(microsecond=0) <= occurred <= after
+        assert len(payload.occurred_at) == len("2024-01-01T00:00:00.000000Z")
+
+    def test_ids_are_unique_uuid4(self):
+        """Test generated ids are distinct RFC 4122 version 4 UUIDs."""
+        ids = [TriggerPayload(name="device.test", data={}, device_id="d").id for _ in range(600)]
+
+        assert len(set(ids)) == len(ids)
+        for value in ids:
+            parsed = uuid.UUID(value)
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+            assert str(parsed) == value
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_does_not_reuse_parent_ids(self):
+        """Test a forked process doesn't hand out the parent's buffered ids."""
+        TriggerPayload(name="device.test", data={}, device_id="d")  # fill the buffer
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                child_id = TriggerPayload(name="device.test", data={}, device_id="d").id
+                os.write(write_fd, child_id.encode())
+            finally:
+                os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as pipe:
+            child_id = pipe.read().decode()
+        os.waitpid(pid, 0)
+
+        parent_id = TriggerPayload(name="device.test", data={}, device_id="d").id
+        assert uuid.UUID(child_id).version == 4
+        assert child_id != parent_id
+
+    def test_uses_slots(self, sample_trigger_payload):
+        """Test TriggerPayload instances carry no per-instance __dict__."""
+        assert not hasattr(sample_trigger_payload, "__dict__")
+
     def test_to_dict_camel_case(self, sample_trigger_payload):
         """Test to_dict() converts to camelCase for server."""
         result = sample_trigger_payload.to_dict()
@@ -72,6 +123,19 @@ class TestTriggerPayload:
         assert "id" in result
         assert "occurredAt" in result
 
+    def test_to_json_matches_to_dict(self, sample_trigger_payload):
+        """Test to_json() encodes the same camelCase body as to_dict()."""
+        body = sample_trigger_payload.to_json()
+
+        assert isinstance(body, bytes)
+        assert json.loads(body) == sample_trigger_payload.to_dict()
+
+    def test_to_json_non_str_data_keys(self):
+        """Test to_json() serializes data dicts with non-str keys."""
+        payload = TriggerPayload(name="device.test", data={1: "one"}, device_id="d")
+
+        assert json.loads(payload.to_json())["data"] == {"1": "one"}
+
     def test_to_dict_with_user_id(self):
         """Test to_dict() with user_id set."""
         payload = TriggerPayload(
@@ -130,6 +194,7 @@ class TestActionTask:
 
         assert task.type == "desktop.action.notification.show"
         assert task.parameters == {"title": "Test", "message": "Message"}
+        assert not hasattr(task, "__dict__")
 
     def test_from_dict_basic(self):
         """Test from_dict() with basic data."""
@@ -3,7 +3,17 @@
 import pytest
 import sys
 from pathlib import Path
-from core.paths import get_app_dir, get_data_dir, get_plugins_dir, get_config_path, is_bundled
+from core.paths import (
+    get_app_dir, get_data_dir, get_plugins_dir, get_config_path, is_bundled, _clear_path_caches,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_paths_cache():
+    """Resolve directories afresh for every test so monkeypatches apply."""
+    _clear_path_caches()
+    yield
+    _clear_path_caches()
 
 
 class TestGetAppDir:
@@ -89,6 +99,18 @@ class TestGetDataDir:
         assert data_dir.exists()
         assert data_dir.is_dir()
 
+    def test_data_dir_cached(self, monkeypatch, tmp_path):
+        """Test get_data_dir() resolves and creates the directory only once."""
+        monkeypatch.setattr(sys, "frozen", True, raising=False)
+        monkeypatch.setattr("sys.platform", "linux")
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+        first = get_data_dir()
+        monkeypatch.setattr(Path, "home", lambda: tmp_path / "other")
+
+        assert get_data_dir() is first
+        assert not (tmp_path / "other").exists()
+
 
 class TestGetPluginsDir:
     """Test cases for get_plugins_dir()."""
@@ -12,6 +12,98 @@ from core.plugin_base import (
 )
 
 
+class _ConcretePlugin(PluginBase):
+    """Minimal PluginBase implementation shared by the tests below."""
+
+    @property
+    def name(self):
+        return "Test"
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+
+class _ConcreteTrigger(TriggerPlugin):
+    """Minimal TriggerPlugin whose start/stop toggle the running flag."""
+
+    @property
+    def name(self):
+        return "Test Trigger"
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    async def start(self):
+        self._running = True
+
+    async def stop(self):
+        self._running = False
+
+
+class _ConcreteAction(ActionPlugin):
+    """Minimal ActionPlugin that records executed actions."""
+
+    def __init__(self, plugin_dir, actions=("TEST",)):
+        super().__init__(plugin_dir)
+        self._actions = list(actions)
+        self.executed = []
+
+    @property
+    def name(self):
+        return "Test Action"
+
+    async def initialize(self):
+        pass
+
+    async def shutdown(self):
+        pass
+
+    def get_supported_actions(self):
+        return self._actions
+
+    async def execute(self, action_type, parameters):
+        self.executed.append((action_type, parameters))
+        return True
+
+
+@pytest.fixture(scope="module")
+def shared_plugin_dirs(tmp_path_factory):
+    """Create each plugin directory once for tests that never write to it.
+
+    Tests that create or modify config.json keep using tmp_path.
+    """
+    base = tmp_path_factory.mktemp("plugin_base")
+    dirs = {}
+    for name in ("test_plugin", "trigger_plugin", "action_plugin"):
+        dirs[name] = base / name
+        dirs[name].mkdir()
+    return dirs
+
+
+@pytest.fixture(scope="module")
+def concrete_plugin():
+    """Concrete PluginBase subclass; call with a plugin directory."""
+    return _ConcretePlugin
+
+
+@pytest.fixture(scope="module")
+def concrete_trigger():
+    """Concrete TriggerPlugin subclass; call with a plugin directory."""
+    return _ConcreteTrigger
+
+
+@pytest.fixture(scope="module")
+def concrete_action():
+    """Concrete ActionPlugin subclass; call with a plugin directory and actions."""
+    return _ConcreteAction
+
+
 class TestPluginEvent:
     """Test cases for PluginEvent dataclass."""
 
@@ -108,74 +200,37 @@ class TestTrayMenuItem:
 class TestPluginBase:
     """Test cases for PluginBase abstract class."""
 
-    def test_init(self, tmp_path):
+    def test_init(self, shared_plugin_dirs, concrete_plugin):
         """Test PluginBase initialization."""
-        plugin_dir = tmp_path / "test_plugin"
-        plugin_dir.mkdir()
-
-        # Create concrete implementation
-        class ConcretePlugin(PluginBase):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
+        plugin_dir = shared_plugin_dirs["test_plugin"]
 
-            async def shutdown(self):
-                pass
-
-        plugin = ConcretePlugin(plugin_dir)
+        plugin = concrete_plugin(plugin_dir)
 
         assert plugin.plugin_dir == plugin_dir
         assert plugin.plugin_id == "test_plugin"
         assert plugin._config == {}
         assert plugin._event_handlers == []
 
-    def test_config_path(self, tmp_path):
+    def test_config_path(self, shared_plugin_dirs, concrete_plugin):
         """Test config_path property."""
-        plugin_dir = tmp_path / "test_plugin"
-        plugin_dir.mkdir()
+        plugin_dir = shared_plugin_dirs["test_plugin"]
 
-        class ConcretePlugin(PluginBase):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
-
-        plugin = ConcretePlugin(plugin_dir)
+        plugin = concrete_plugin(plugin_dir)
 
         assert plugin.config_path == plugin_dir / "config.json"
 
-    def test_load_config_nonexistent(self, tmp_path):
+    def test_load_config_nonexistent(self, shared_plugin_dirs, concrete_plugin):
         """Test load_config() with nonexistent file."""
-        plugin_dir = tmp_path / "test_plugin"
-        plugin_dir.mkdir()
-
-        class ConcretePlugin(PluginBase):
-            @property
-            def name(self):
-                return "Test"
+        plugin_dir = shared_plugin_dirs["test_plugin"]
 
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
-
-        plugin = ConcretePlugin(plugin_dir)
+        plugin = concrete_plugin(plugin_dir)
         result = plugin.load_config()
 
         # When config file doesn't exist, defaults to enabled
         assert result == {"enabled": True}
         assert plugin._config == {"enabled": True}
 
-    def test_load_config_existing(self, tmp_path):
+    def test_load_config_existing(self, tmp_path, concrete_plugin):
         """Test load_config() with existing config file."""
         plugin_dir = tmp_path / "test_plugin"
         plugin_dir.mkdir()
@@ -184,43 +239,58 @@ class TestPluginBase:
         config_data = {"enabled": True, "custom": "value"}
         (plugin_dir / "config.json").write_text(json.dumps(config_data))
 
-        class ConcretePlugin(PluginBase):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
-
-        plugin = ConcretePlugin(plugin_dir)
+        plugin = concrete_plugin(plugin_dir)
         result = plugin.load_config()
 
         assert result == config_data
         assert plugin._config == config_data
 
-    def test_load_config_invalid_json(self, tmp_path):
-        """Test load_config() with invalid JSON disables plugin."""
+    def test_load_config_reads_current_file(self, tmp_path, monkeypatch, concrete_plugin):
+        """Test every load_config() parses and validates the file as it is now."""
         plugin_dir = tmp_path / "test_plugin"
         plugin_dir.mkdir()
+        config_file = plugin_dir / "config.json"
+        config_file.write_text(json.dumps({"enabled": True, "custom": "value"}))
 
-        # Create invalid JSON file
-        (plugin_dir / "config.json").write_text("{invalid json")
+        validate_calls = []
+        monkeypatch.setattr(
+            concrete_plugin, "validate_config",
+            lambda self: validate_calls.append(self) or (True, ""),
+        )
+
+        assert concrete_plugin(plugin_dir).load_config()["custom"] == "value"
+
+        # Same size, possibly the same mtime - still picked up
+        config_file.write_text(json.dumps({"enabled": True, "custom": "other"}))
+        assert concrete_plugin(plugin_dir).load_config()["custom"] == "other"
+        assert len(validate_calls) == 2
 
-        class ConcretePlugin(PluginBase):
-            @property
-            def name(self):
-                return "Test"
+    def test_load_config_instances_do_not_share_nested_values(self, tmp_path, concrete_plugin):
+        """Test mutating a nested config value does not leak into other instances."""
+        plugin_dir = tmp_path / "test_plugin"
+        plugin_dir.mkdir()
+        (plugin_dir / "config.json").write_text(
+            json.dumps({"enabled": True, "buttons": [{"name": "A"}], "nested": {"k": 1}})
+        )
 
-            async def initialize(self):
-                pass
+        plugin = concrete_plugin(plugin_dir)
+        plugin.load_config()
+        plugin.get_config("buttons").append({"name": "B"})
+        plugin.get_config("nested")["k"] = 2
 
-            async def shutdown(self):
-                pass
+        fresh = concrete_plugin(plugin_dir).load_config()
+        assert fresh["buttons"] == [{"name": "A"}]
+        assert fresh["nested"] == {"k": 1}
 
-        plugin = ConcretePlugin(plugin_dir)
+    def test_load_config_invalid_json(self, tmp_path, concrete_plugin):
+        """Test load_config() with invalid JSON disables plugin."""
+        plugin_dir = tmp_path / "test_plugin"
+        plugin_dir.mkdir()
+
+        # Create invalid JSON file
+        (plugin_dir / "config.json").write_text("{invalid json")
+
+        plugin = concrete_plugin(plugin_dir)
         result = plugin.load_config()
 
         # Plugin should be disabled on invalid JSON
@@ -228,7 +298,7 @@ class TestPluginBase:
         assert plugin._config == {"enabled": False}
         assert plugin.enabled is False
 
-    def test_load_config_corrupted_file(self, tmp_path):
+    def test_load_config_corrupted_file(self, tmp_path, concrete_plugin):
         """Test load_config() with corrupted file disables plugin."""
         plugin_dir = tmp_path / "test_plugin"
         plugin_dir.mkdir()
@@ -236,18 +306,7 @@ class TestPluginBase:
         # Create file with non-JSON content
         (plugin_dir / "config.json").write_text("not json at all")
 
-        class ConcretePlugin(PluginBase):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
-
-        plugin = ConcretePlugin(plugin_dir)
+        plugin = concrete_plugin(plugin_dir)
         result = plugin.load_config()
 
         # Plugin should be disabled on corrupted file
@@ -255,23 +314,12 @@ class TestPluginBase:
         assert plugin._config == {"enabled": False}
         assert plugin.enabled is False
 
-    def test_save_config(self, tmp_path):
+    def test_save_config(self, tmp_path, concrete_plugin):
         """Test save_config() creates file."""
         plugin_dir = tmp_path / "test_plugin"
         plugin_dir.mkdir()
 
-        class ConcretePlugin(PluginBase):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
-
-        plugin = ConcretePlugin(plugin_dir)
+        plugin = concrete_plugin(plugin_dir)
         plugin._config = {"test": "data"}
         plugin.save_config()
 
@@ -281,46 +329,22 @@ class TestPluginBase:
         saved_data = json.loads(config_path.read_text())
         assert saved_data == {"test": "data"}
 
-    def test_get_config(self, tmp_path):
+    def test_get_config(self, shared_plugin_dirs, concrete_plugin):
         """Test get_config() method."""
-        plugin_dir = tmp_path / "test_plugin"
-        plugin_dir.mkdir()
-
-        class ConcretePlugin(PluginBase):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
+        plugin_dir = shared_plugin_dirs["test_plugin"]
 
-            async def shutdown(self):
-                pass
-
-        plugin = ConcretePlugin(plugin_dir)
+        plugin = concrete_plugin(plugin_dir)
         plugin._config = {"key": "value"}
 
         assert plugin.get_config("key") == "value"
         assert plugin.get_config("nonexistent") is None
         assert plugin.get_config("nonexistent", "default") == "default"
 
-    def test_set_config(self, tmp_path):
+    def test_set_config(self, shared_plugin_dirs, concrete_plugin):
         """Test set_config() method."""
-        plugin_dir = tmp_path / "test_plugin"
-        plugin_dir.mkdir()
+        plugin_dir = shared_plugin_dirs["test_plugin"]
 
-        class ConcretePlugin(PluginBase):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
-
-        plugin = ConcretePlugin(plugin_dir)
+        plugin = concrete_plugin(plugin_dir)
 
         plugin.set_config("key", "value")
         assert plugin._config["key"] == "value"
@@ -328,65 +352,29 @@ class TestPluginBase:
         plugin.set_config("key", "new_value")
         assert plugin._config["key"] == "new_value"
 
-    def test_enabled_property_true(self, tmp_path):
+    def test_enabled_property_true(self, shared_plugin_dirs, concrete_plugin):
         """Test enabled property returns True."""
-        plugin_dir = tmp_path / "test_plugin"
-        plugin_dir.mkdir()
-
-        class ConcretePlugin(PluginBase):
-            @property
-            def name(self):
-                return "Test"
+        plugin_dir = shared_plugin_dirs["test_plugin"]
 
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
-
-        plugin = ConcretePlugin(plugin_dir)
+        plugin = concrete_plugin(plugin_dir)
         plugin._config = {"enabled": True}
 
         assert plugin.enabled is True
 
-    def test_enabled_property_false(self, tmp_path):
+    def test_enabled_property_false(self, shared_plugin_dirs, concrete_plugin):
         """Test enabled property returns False."""
-        plugin_dir = tmp_path / "test_plugin"
-        plugin_dir.mkdir()
-
-        class ConcretePlugin(PluginBase):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
+        plugin_dir = shared_plugin_dirs["test_plugin"]
 
-            async def shutdown(self):
-                pass
-
-        plugin = ConcretePlugin(plugin_dir)
+        plugin = concrete_plugin(plugin_dir)
         plugin._config = {"enabled": False}
 
         assert plugin.enabled is False
 
-    def test_enabled_property_default_true(self, tmp_path):
+    def test_enabled_property_default_true(self, shared_plugin_dirs, concrete_plugin):
         """Test enabled defaults to True if not in config."""
-        plugin_dir = tmp_path / "test_plugin"
-        plugin_dir.mkdir()
-
-        class ConcretePlugin(PluginBase):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
+        plugin_dir = shared_plugin_dirs["test_plugin"]
 
-            async def shutdown(self):
-                pass
-
-        plugin = ConcretePlugin(plugin_dir)
+        plugin = concrete_plugin(plugin_dir)
         plugin._config = {}
 
         assert plugin.enabled is True
@@ -395,23 +383,11 @@ class TestPluginBase:
 class TestPluginEventSystem:
     """Test cases for plugin event system."""
 
-    def test_on_event_registration(self, tmp_path):
+    def test_on_event_registration(self, shared_plugin_dirs, concrete_plugin):
         """Test registering event handler."""
-        plugin_dir = tmp_path / "test_plugin"
-        plugin_dir.mkdir()
-
-        class ConcretePlugin(PluginBase):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
+        plugin_dir = shared_plugin_dirs["test_plugin"]
 
-        plugin = ConcretePlugin(plugin_dir)
+        plugin = concrete_plugin(plugin_dir)
 
         def handler(event):
             pass
@@ -421,23 +397,11 @@ class TestPluginEventSystem:
         assert handler in plugin._event_handlers
         assert len(plugin._event_handlers) == 1
 
-    def test_multiple_event_handlers(self, tmp_path):
+    def test_multiple_event_handlers(self, shared_plugin_dirs, concrete_plugin):
         """Test registering multiple event handlers."""
-        plugin_dir = tmp_path / "test_plugin"
-        plugin_dir.mkdir()
-
-        class ConcretePlugin(PluginBase):
-            @property
-            def name(self):
-                return "Test"
+        plugin_dir = shared_plugin_dirs["test_plugin"]
 
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
-
-        plugin = ConcretePlugin(plugin_dir)
+        plugin = concrete_plugin(plugin_dir)
 
         handler1 = lambda e: None
         handler2 = lambda e: None
@@ -447,23 +411,11 @@ class TestPluginEventSystem:
 
         assert len(plugin._event_handlers) == 2
 
-    def test_emit_event_calls_handlers(self, tmp_path):
+    def test_emit_event_calls_handlers(self, shared_plugin_dirs, concrete_plugin):
         """Test emit_event() calls all registered handlers."""
-        plugin_dir = tmp_path / "test_plugin"
-        plugin_dir.mkdir()
-
-        class ConcretePlugin(PluginBase):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
+        plugin_dir = shared_plugin_dirs["test_plugin"]
 
-            async def shutdown(self):
-                pass
-
-        plugin = ConcretePlugin(plugin_dir)
+        plugin = concrete_plugin(plugin_dir)
 
         events_received = []
 
@@ -478,23 +430,11 @@ class TestPluginEventSystem:
         assert events_received[0].event_name == "test.event"
         assert events_received[0].data == {"data": "value"}
 
-    def test_emit_event_without_data(self, tmp_path):
+    def test_emit_event_without_data(self, shared_plugin_dirs, concrete_plugin):
         """Test emit_event() with no data parameter."""
-        plugin_dir = tmp_path / "test_plugin"
-        plugin_dir.mkdir()
+        plugin_dir = shared_plugin_dirs["test_plugin"]
 
-        class ConcretePlugin(PluginBase):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
-
-        plugin = ConcretePlugin(plugin_dir)
+        plugin = concrete_plugin(plugin_dir)
 
         events_received = []
         plugin.on_event(lambda e: events_received.append(e))
@@ -503,23 +443,11 @@ class TestPluginEventSystem:
         assert len(events_received) == 1
         assert events_received[0].data == {}
 
-    def test_emit_event_multiple_handlers(self, tmp_path):
+    def test_emit_event_multiple_handlers(self, shared_plugin_dirs, concrete_plugin):
         """Test emit_event() calls all handlers."""
-        plugin_dir = tmp_path / "test_plugin"
-        plugin_dir.mkdir()
-
-        class ConcretePlugin(PluginBase):
-            @property
-            def name(self):
-                return "Test"
+        plugin_dir = shared_plugin_dirs["test_plugin"]
 
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
-
-        plugin = ConcretePlugin(plugin_dir)
+        plugin = concrete_plugin(plugin_dir)
 
         calls = {"handler1": 0, "handler2": 0}
 
@@ -540,55 +468,19 @@ class TestPluginEventSystem:
 class TestTriggerPlugin:
     """Test cases for TriggerPlugin class."""
 
-    def test_init(self, tmp_path):
+    def test_init(self, shared_plugin_dirs, concrete_trigger):
         """Test TriggerPlugin initialization."""
-        plugin_dir = tmp_path / "trigger_plugin"
-        plugin_dir.mkdir()
-
-        class ConcreteTrigger(TriggerPlugin):
-            @property
-            def name(self):
-                return "Test Trigger"
-
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
+        plugin_dir = shared_plugin_dirs["trigger_plugin"]
 
-            async def start(self):
-                pass
-
-            async def stop(self):
-                pass
-
-        plugin = ConcreteTrigger(plugin_dir)
+        plugin = concrete_trigger(plugin_dir)
 
         assert plugin._running is False
 
-    def test_running_property(self, tmp_path):
+    def test_running_property(self, shared_plugin_dirs, concrete_trigger):
         """Test running property."""
-        plugin_dir = tmp_path / "trigger_plugin"
-        plugin_dir.mkdir()
-
-        class ConcreteTrigger(TriggerPlugin):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
+        plugin_dir = shared_plugin_dirs["trigger_plugin"]
 
-            async def start(self):
-                self._running = True
-
-            async def stop(self):
-                self._running = False
-
-        plugin = ConcreteTrigger(plugin_dir)
+        plugin = concrete_trigger(plugin_dir)
 
         assert plugin.running is False
 
@@ -601,29 +493,11 @@ class TestTriggerPlugin:
         assert plugin.running is False
 
     @pytest.mark.asyncio
-    async def test_start_stop_lifecycle(self, tmp_path):
+    async def test_start_stop_lifecycle(self, shared_plugin_dirs, concrete_trigger):
         """Test start/stop lifecycle."""
-        plugin_dir = tmp_path / "trigger_plugin"
-        plugin_dir.mkdir()
-
-        class ConcreteTrigger(TriggerPlugin):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
+        plugin_dir = shared_plugin_dirs["trigger_plugin"]
 
-            async def start(self):
-                self._running = True
-
-            async def stop(self):
-                self._running = False
-
-        plugin = ConcreteTrigger(plugin_dir)
+        plugin = concrete_trigger(plugin_dir)
 
         await plugin.start()
         assert plugin.running is True
@@ -632,60 +506,26 @@ class TestTriggerPlugin:
         assert plugin.running is False
 
 
+class _TriggerWithCapabilities(_ConcreteTrigger):
+    def get_capabilities(self):
+        return {"device.test.event": ["param1", "param2"]}
+
+
 class TestTriggerPluginCapabilities:
     """Test cases for TriggerPlugin.get_capabilities()."""
 
-    def test_default_get_capabilities(self, tmp_path):
+    def test_default_get_capabilities(self, shared_plugin_dirs, concrete_trigger):
         """Test default get_capabilities() returns empty dict."""
-        plugin_dir = tmp_path / "trigger_plugin"
-        plugin_dir.mkdir()
+        plugin_dir = shared_plugin_dirs["trigger_plugin"]
 
-        class ConcreteTrigger(TriggerPlugin):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
-
-            async def start(self):
-                pass
-
-            async def stop(self):
-                pass
-
-        plugin = ConcreteTrigger(plugin_dir)
+        plugin = concrete_trigger(plugin_dir)
         assert plugin.get_capabilities() == {}
 
-    def test_overridden_get_capabilities(self, tmp_path):
+    def test_overridden_get_capabilities(self, shared_plugin_dirs):
         """Test overridden get_capabilities() returns custom values."""
-        plugin_dir = tmp_path / "trigger_plugin"
-        plugin_dir.mkdir()
-
-        class ConcreteTrigger(TriggerPlugin):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
-
-            async def start(self):
-                pass
-
-            async def stop(self):
-                pass
-
-            def get_capabilities(self):
-                return {"device.test.event": ["param1", "param2"]}
+        plugin_dir = shared_plugin_dirs["trigger_plugin"]
 
-        plugin = ConcreteTrigger(plugin_dir)
+        plugin = _TriggerWithCapabilities(plugin_dir)
         caps = plugin.get_capabilities()
         assert caps == {"device.test.event": ["param1", "param2"]}
 
@@ -693,148 +533,57 @@ class TestTriggerPluginCapabilities:
 class TestActionPlugin:
     """Test cases for ActionPlugin class."""
 
-    def test_init(self, tmp_path):
+    def test_init(self, shared_plugin_dirs, concrete_action):
         """Test ActionPlugin initialization."""
-        plugin_dir = tmp_path / "action_plugin"
-        plugin_dir.mkdir()
-
-        class ConcreteAction(ActionPlugin):
-            @property
-            def name(self):
-                return "Test Action"
-
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
-
-            def get_supported_actions(self):
-                return ["TEST_ACTION"]
-
-            async def execute(self, action_type, parameters):
-                return True
+        plugin_dir = shared_plugin_dirs["action_plugin"]
 
-        plugin = ConcreteAction(plugin_dir)
+        plugin = concrete_action(plugin_dir, ["TEST_ACTION"])
 
         assert isinstance(plugin, ActionPlugin)
 
-    def test_get_supported_actions(self, tmp_path):
+    def test_get_supported_actions(self, shared_plugin_dirs, concrete_action):
         """Test get_supported_actions() method."""
-        plugin_dir = tmp_path / "action_plugin"
-        plugin_dir.mkdir()
-
-        class ConcreteAction(ActionPlugin):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
-
-            def get_supported_actions(self):
-                return ["ACTION1", "ACTION2", "ACTION3"]
+        plugin_dir = shared_plugin_dirs["action_plugin"]
 
-            async def execute(self, action_type, parameters):
-                return True
-
-        plugin = ConcreteAction(plugin_dir)
+        plugin = concrete_action(plugin_dir, ["ACTION1", "ACTION2", "ACTION3"])
 
         actions = plugin.get_supported_actions()
         assert actions == ["ACTION1", "ACTION2", "ACTION3"]
 
     @pytest.mark.asyncio
-    async def test_execute(self, tmp_path):
+    async def test_execute(self, shared_plugin_dirs, concrete_action):
         """Test execute() method."""
-        plugin_dir = tmp_path / "action_plugin"
-        plugin_dir.mkdir()
-
-        executed_actions = []
-
-        class ConcreteAction(ActionPlugin):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
+        plugin_dir = shared_plugin_dirs["action_plugin"]
 
-            def get_supported_actions(self):
-                return ["TEST"]
-
-            async def execute(self, action_type, parameters):
-                executed_actions.append((action_type, parameters))
-                return True
-
-        plugin = ConcreteAction(plugin_dir)
+        plugin = concrete_action(plugin_dir, ["TEST"])
 
         result = await plugin.execute("TEST", {"param": "value"})
 
         assert result is True
-        assert len(executed_actions) == 1
-        assert executed_actions[0] == ("TEST", {"param": "value"})
+        assert len(plugin.executed) == 1
+        assert plugin.executed[0] == ("TEST", {"param": "value"})
+
+
+class _ActionWithCapabilities(_ConcreteAction):
+    def get_capabilities(self):
+        return {"ACTION_A": ["param1", "param2"]}
 
 
 class TestActionPluginCapabilities:
     """Test cases for ActionPlugin.get_capabilities()."""
 
-    def test_default_get_capabilities(self, tmp_path):
+    def test_default_get_capabilities(self, shared_plugin_dirs, concrete_action):
         """Test default get_capabilities() returns actions with empty params."""
-        plugin_dir = tmp_path / "action_plugin"
-        plugin_dir.mkdir()
-
-        class ConcreteAction(ActionPlugin):
-            @property
-            def name(self):
-                return "Test"
+        plugin_dir = shared_plugin_dirs["action_plugin"]
 
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
-
-            def get_supported_actions(self):
-                return ["ACTION_A", "ACTION_B"]
-
-            async def execute(self, action_type, parameters):
-                return True
-
-        plugin = ConcreteAction(plugin_dir)
+        plugin = concrete_action(plugin_dir, ["ACTION_A", "ACTION_B"])
         caps = plugin.get_capabilities()
         assert caps == {"ACTION_A": [], "ACTION_B": []}
 
-    def test_overridden_get_capabilities(self, tmp_path):
+    def test_overridden_get_capabilities(self, shared_plugin_dirs):
         """Test overridden get_capabilities() returns custom values."""
-        plugin_dir = tmp_path / "action_plugin"
-        plugin_dir.mkdir()
-
-        class ConcreteAction(ActionPlugin):
-            @property
-            def name(self):
-                return "Test"
-
-            async def initialize(self):
-                pass
-
-            async def shutdown(self):
-                pass
-
-            def get_supported_actions(self):
-                return ["ACTION_A"]
-
-            async def execute(self, action_type, parameters):
-                return True
-
-            def get_capabilities(self):
-                return {"ACTION_A": ["param1", "param2"]}
+        plugin_dir = shared_plugin_dirs["action_plugin"]
 
-        plugin = ConcreteAction(plugin_dir)
+        plugin = _ActionWithCapabilities(plugin_dir, ["ACTION_A"])
         caps = plugin.get_capabilities()
         assert caps == {"ACTION_A": ["param1", "param2"]}
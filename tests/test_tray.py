@@ -1,5 +1,8 @@
 """Tests for ui.tray module."""
 
+import subprocess
+import sys
+
 import pytest
 from unittest.mock import MagicMock, patch
 from pathlib import Path
@@ -45,6 +48,16 @@ class TestConnectionStatus:
         assert ConnectionStatus.DISCONNECTED.value == "disconnected"
         assert ConnectionStatus.ERROR.value == "error"
 
+    def test_tray_enums_import_without_qt(self):
+        """Test ui.tray_enums can be imported without loading PySide6."""
+        result = subprocess.run(
+            [sys.executable, "-c",
+             "import sys, ui.tray_enums; sys.exit('PySide6' in sys.modules)"],
+            cwd=Path(__file__).parent.parent,
+        )
+
+        assert result.returncode == 0
+
 
 class TestTrayManagerConnectionStatus:
     """Tests for TrayManager connection status functionality."""
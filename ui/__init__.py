@@ -1,6 +1,25 @@
-"""UI module for Agimate Desktop."""
+"""UI module for Agimate Desktop.
 
-from .tray import TrayManager, NotificationType
-from .settings import SettingsWindow
+Qt-based classes are imported lazily on first attribute access, so
+``ui.tray_enums`` can be imported without loading PySide6.
+"""
+
+import importlib
 
 __all__ = ["TrayManager", "NotificationType", "SettingsWindow"]
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    "TrayManager": ".tray",
+    "NotificationType": ".tray_enums",
+    "SettingsWindow": ".settings",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
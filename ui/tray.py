@@ -6,8 +6,6 @@ import subprocess
 from pathlib import Path
 from typing import Callable, TYPE_CHECKING
 
-from enum import Enum
-
 from PySide6.QtWidgets import QSystemTrayIcon, QMenu, QApplication, QMessageBox
 from PySide6.QtGui import QIcon, QAction
 from PySide6.QtCore import Signal, QObject
@@ -19,6 +17,9 @@ from core.constants import (
     PLATFORM_WINDOWS,
 )
 from core.platform_commands import MacOSCommands, LinuxCommands, WindowsCommands
+from core.plugin_base import TrayMenuItem
+# Re-exported for callers that import the enums from ui.tray
+from ui.tray_enums import NotificationType, ConnectionStatus
 
 if TYPE_CHECKING:
     from core.event_bus import EventBus, Topics
@@ -26,22 +27,6 @@ if TYPE_CHECKING:
 # Subprocess timeout in seconds (to prevent hanging)
 SUBPROCESS_TIMEOUT = 5.0
 
-
-class NotificationType(Enum):
-    """Type of notification to show."""
-    SYSTEM = "system"  # Native system notification (non-blocking)
-    MODAL = "modal"    # Modal dialog (blocking, requires user action)
-
-
-class ConnectionStatus(Enum):
-    """Connection status for tray icon."""
-    CONNECTING = "connecting"
-    CONNECTED = "connected"
-    DISCONNECTED = "disconnected"
-    ERROR = "error"
-
-from core.plugin_base import TrayMenuItem
-
 logger = logging.getLogger(__name__)
 
 
@@ -0,0 +1,17 @@
+"""Enums for the system tray, kept free of Qt imports."""
+
+from enum import Enum
+
+
+class NotificationType(Enum):
+    """Type of notification to show."""
+    SYSTEM = "system"  # Native system notification (non-blocking)
+    MODAL = "modal"    # Modal dialog (blocking, requires user action)
+
+
+class ConnectionStatus(Enum):
+    """Connection status for tray icon."""
+    CONNECTING = "connecting"
+    CONNECTED = "connected"
+    DISCONNECTED = "disconnected"
+    ERROR = "error"